@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+from tkwidgets.benchmark import BENCHMARKS, compare, run
+
+def results(**times):
+	return {'n': 1000, 'results': times}
+
+def test_compare():
+	baseline = results(fast=1.0, slow=1.0, removed=1.0, zero=0.0)
+	current = results(fast=1.2, slow=1.5, added=9.0, zero=1.0)
+	assert compare(current, baseline, 0.25) == [('slow', 1.0, 1.5, 1.5)]
+	assert compare(current, baseline, 0.1) == [('fast', 1.0, 1.2, 1.2), ('slow', 1.0, 1.5, 1.5)]
+
+# needs a display, e.g. xvfb-run python -m pytest tests
+@pytest.mark.skipif(not os.environ.get('DISPLAY'), reason='no X display')
+def test_run():
+	try:
+		tk.Tk().destroy()
+	except tk.TclError as error:
+		pytest.skip(str(error))
+	current = run(n=10, repeat=1)
+	assert sorted(current['results']) == sorted(BENCHMARKS)
+	assert all(taken >= 0 for taken in current['results'].values())
+	assert compare(current, current) == []
@@ -0,0 +1,76 @@
+import atexit
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tkwidgets import debuglogger
+
+@pytest.fixture(autouse=True)
+def no_atexit(monkeypatch):
+	monkeypatch.setattr(atexit, 'register', lambda *args: None)
+
+def write_capture(path, writes):
+	writer = debuglogger.CaptureWriter(str(path))
+	for text, stream in writes:
+		writer.write(text, stream, when=1.0)
+	writer.close()
+
+def test_round_trip(tmp_path):
+	path = tmp_path / 'capture.bin'
+	writes = [('line %d\n' % i, 'stdout' if i % 2 else 'stderr') for i in range(100)]
+	writes.append((u'ünï \U0001f600 \x1e\x1f\n', 'stdout'))
+	write_capture(path, writes)
+	with debuglogger.CaptureReader(str(path)) as reader:
+		assert [(text, stream) for text, stream, when in reader] == writes
+		assert [(text, stream) for text, stream, when in reader.tail(3)] == writes[-3:]
+		assert reader.tail(1000) == list(reader)
+
+def test_append_keeps_one_header(tmp_path):
+	path = tmp_path / 'capture.bin'
+	write_capture(path, [('a\n', 'stdout')])
+	write_capture(path, [('b\n', 'stderr')])
+	with debuglogger.CaptureReader(str(path)) as reader:
+		assert [text for text, stream, when in reader] == ['a\n', 'b\n']
+
+def test_empty_file(tmp_path):
+	path = tmp_path / 'capture.bin'
+	path.write_bytes(b'')
+	with debuglogger.CaptureReader(str(path)) as reader:
+		assert reader.tail(5) == []
+		assert list(reader) == []
+
+def test_not_a_capture(tmp_path):
+	path = tmp_path / 'capture.bin'
+	path.write_bytes(b'plain text\n')
+	with pytest.raises(ValueError):
+		debuglogger.CaptureReader(str(path))
+
+def test_torn_last_record(tmp_path):
+	path = tmp_path / 'capture.bin'
+	write_capture(path, [('a\n', 'stdout'), ('b\n', 'stdout')])
+	with open(str(path), 'ab') as f:
+		f.write(debuglogger._CAPTURE_SYNC + b'\x00\x00torn')
+	with debuglogger.CaptureReader(str(path)) as reader:
+		assert [text for text, stream, when in reader.tail(5)] == ['a\n', 'b\n']
+		assert [text for text, stream, when in reader] == ['a\n', 'b\n']
+
+def test_torn_record_mid_file(tmp_path):
+	# a crash tore a record, then the next run appended to the same file
+	path = tmp_path / 'capture.bin'
+	write_capture(path, [('a\n', 'stdout')])
+	with open(str(path), 'ab') as f:
+		f.write(debuglogger._CAPTURE_SYNC + b'\x00\x00\x00\x00\x00\x00\xf0\x3f\x01\xff\xff\x00\x00torn')
+	write_capture(path, [('b\n', 'stderr'), ('c\n', 'stdout')])
+	with debuglogger.CaptureReader(str(path)) as reader:
+		assert [text for text, stream, when in reader] == ['a\n', 'b\n', 'c\n']
+		assert [text for text, stream, when in reader.tail(5)] == ['a\n', 'b\n', 'c\n']
+
+def test_import_is_minimal():
+	# logging.handlers (with socket), mmap and struct are only needed by log_to_file and captures
+	code = ('import sys, tkwidgets.debuglogger; '
+		'print(" ".join(m for m in ("logging.handlers", "socket", "mmap", "struct") if m in sys.modules))')
+	out = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True,
+		cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+	assert out.split() == []
@@ -0,0 +1,28 @@
+import gc
+
+from tkwidgets.debounce import Debounce
+
+class Widget(Debounce):
+	def on_key(self, event):
+		return 'widget'
+
+class App(object):
+	def on_key(self, event):
+		return 'app'
+
+def test_other_methods_are_kept():
+	# root.bind('<KeyPress-a>', App(root).on_key), the binding is all that holds App
+	widget = Widget()
+	evdict = {'KeyPress': widget._callback_ref(App().on_key)}
+	gc.collect()
+	assert Debounce._callback(evdict, 'KeyPress', None) == 'app'
+	evdict = {'KeyPress': widget._callback_ref(lambda event: 'lambda')}
+	assert Debounce._callback(evdict, 'KeyPress', None) == 'lambda'
+
+def test_own_methods_go_with_the_widget():
+	widget = Widget()
+	evdict = {'KeyPress': widget._callback_ref(widget.on_key)}
+	assert Debounce._callback(evdict, 'KeyPress', None) == 'widget'
+	del widget
+	gc.collect()
+	assert Debounce._callback(evdict, 'KeyPress', None) is None
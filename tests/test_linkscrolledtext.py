@@ -0,0 +1,88 @@
+import pytest
+
+from tkwidgets.linkscrolledtext import HyperlinkManager
+
+class FakeText(object):
+	'''the parts of a Text widget HyperlinkManager uses, without a display'''
+	def __init__(self):
+		self.content = ''
+		self.tags = {}
+		self.options = {'state': 'normal'}
+		self.calls = []
+
+	def tag_config(self, *args, **kwargs):
+		pass
+
+	def tag_bind(self, *args):
+		pass
+
+	def cget(self, option):
+		return self.options[option]
+
+	def configure(self, **options):
+		self.options.update(options)
+
+	def _edit(self, name, *args):
+		self.calls.append((name, self.options['state']))
+		if self.options['state'] == 'disabled':
+			return # Tk ignores edits of a disabled widget
+		if name == 'delete':
+			self.content, self.tags = '', {}
+		elif name == 'insert':
+			self.content = args[1]
+		elif name == 'tag_add':
+			self.tags[args[0]] = list(args[1:])
+
+	def delete(self, *args):
+		self._edit('delete', *args)
+
+	def insert(self, *args):
+		self._edit('insert', *args)
+
+	def tag_add(self, *args):
+		self._edit('tag_add', *args)
+
+	def tag_names(self):
+		return ['sel'] + list(self.tags)
+
+	def tag_ranges(self, tag):
+		return self.tags.get(tag, [])
+
+	def get(self, start, end):
+		return self.content
+
+def test_dump_load_registered():
+	text = FakeText()
+	manager = HyperlinkManager(text)
+	action = lambda: None
+	manager.register('open', action)
+	manager.add(action, 'tip')
+	manager.add('open')
+	text.content = 'one two'
+	text.tags = {'hyper': ['1.0', '1.7'], 'hyper-0': ['1.0', '1.3'], 'hyper-1': ['1.4', '1.7']}
+	data = manager.dump()
+	assert data['links'] == {'hyper-0': ['open', 'tip'], 'hyper-1': ['open', None]}
+
+	copy = FakeText()
+	loaded = HyperlinkManager(copy)
+	loaded.register('open', action)
+	loaded.load(data)
+	assert copy.content == 'one two'
+	assert copy.tags == text.tags
+	assert loaded._resolve(loaded.links['hyper-0'][0]) is action
+
+def test_dump_unregistered_raises():
+	text = FakeText()
+	manager = HyperlinkManager(text)
+	manager.add(lambda: None)
+	with pytest.raises(ValueError):
+		manager.dump()
+
+def test_load_disabled():
+	text = FakeText()
+	manager = HyperlinkManager(text)
+	text.configure(state='disabled')
+	manager.load({'text': 'read only', 'tags': {'hyper': ['1.0', '1.4']}, 'links': {}})
+	assert text.content == 'read only'
+	assert all(state == 'normal' for name, state in text.calls)
+	assert text.cget('state') == 'disabled'
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+from tkwidgets import tk_window_no_focus
+from tkwidgets.tk_window_no_focus import get_input_hint, set_no_focus
+
+# needs an X server, e.g. xvfb-run python -m pytest tests
+pytestmark = pytest.mark.skipif(not os.environ.get('DISPLAY'), reason='no X display')
+
+@pytest.fixture
+def root():
+	try:
+		root = tk.Tk()
+	except tk.TclError as error:
+		pytest.skip(str(error))
+	if root.tk.call('tk', 'windowingsystem') != 'x11':
+		root.destroy()
+		pytest.skip('not X11')
+	yield root
+	root.destroy()
+
+def test_before_mapped(root):
+	top = tk.Toplevel(root)
+	set_no_focus(top, 'utility')
+	top.update()
+	assert str(top.cget('takefocus')) == '0'
+	assert 'utility' in str(top.wm_attributes('-type')).lower()
+	assert get_input_hint(top) is False
+
+def test_mapped(root):
+	top = tk.Toplevel(root)
+	top.update()
+	assert get_input_hint(top) is True
+	set_no_focus(top)
+	assert get_input_hint(top) is False
+	# Tk sets its own hints again when the window is shown after being hidden
+	top.withdraw()
+	top.update()
+	top.deiconify()
+	top.update()
+	assert get_input_hint(top) is False
+
+def test_many_windows(root):
+	windows = [tk.Toplevel(root) for i in range(20)]
+	for top in windows:
+		set_no_focus(top)
+		set_no_focus(top) # a second call doesn't add another binding
+	root.update()
+	assert all(get_input_hint(top) is False for top in windows)
+	assert windows[0].bindtags().count('TkwidgetsNoFocus') == 1
+
+def test_x_errors_raise(root):
+	# Xlib's default handler would exit the process
+	top = tk.Toplevel(root)
+	top.update()
+	display = tk_window_no_focus._x11_display(top)
+	x11 = tk_window_no_focus._load_x11()
+	with pytest.raises(RuntimeError):
+		tk_window_no_focus._x11_trapped(display, x11.XGetWMHints, display, 0x3fffffff)
+	top._no_focus_wrapper = 0x3fffffff # stale
+	with pytest.raises(RuntimeError):
+		get_input_hint(top)
+	assert get_input_hint(top) is True # looked up again
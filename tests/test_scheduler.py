@@ -0,0 +1,119 @@
+from tkwidgets import scheduler
+from tkwidgets.scheduler import Scheduler
+
+class FakeRoot(object):
+	'''stands in for Tk, after callbacks are kept until the test runs them'''
+	def __init__(self):
+		self.idle = []
+		self.later = []
+		self.errors = []
+
+	def _root(self):
+		return self
+
+	def after_idle(self, func):
+		self.idle.append(func)
+		return 'idle#%d' % len(self.idle)
+
+	def after(self, ms, func):
+		self.later.append((ms, func))
+		return 'after#%d' % len(self.later)
+
+	def report_callback_exception(self, *exc_info):
+		self.errors.append(exc_info[1])
+
+def test_get_is_per_root():
+	root, other = FakeRoot(), FakeRoot()
+	assert Scheduler.get(root) is Scheduler.get(root)
+	assert Scheduler.get(root) is not Scheduler.get(other)
+
+def test_priority_then_order():
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	ran = []
+	tasks.submit(ran.append, ('late',), key='a', priority=5)
+	tasks.submit(ran.append, ('first',), key='b')
+	tasks.submit(ran.append, ('second',), key='c')
+	tasks.submit(ran.append, ('urgent',), key='d', priority=-1)
+	assert len(root.idle) == 1
+	root.idle.pop()()
+	assert ran == ['urgent', 'first', 'second', 'late']
+	assert not root.later
+
+def test_coalescing():
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	ran = []
+	tasks.submit(ran.append, ('a',), key='x', priority=5)
+	tasks.submit(ran.append, ('b',), key='y')
+	# replaces the waiting task, keeping its place and the lower priority
+	tasks.submit(ran.append, ('a2',), key='x', priority=-1)
+	tasks.submit(ran.append, ('a3',), key='x', priority=9)
+	assert tasks.pending('x')
+	tasks.flush()
+	assert ran == ['a3', 'b']
+	assert not tasks.pending('x')
+
+def test_cancel():
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	ran = []
+	tasks.submit(ran.append, ('a',), key='a')
+	tasks.submit(lambda: tasks.cancel('b'), key='c', priority=-1)
+	tasks.submit(ran.append, ('b',), key='b')
+	tasks.flush()
+	assert ran == ['a']
+
+def test_budget_carries_over(monkeypatch):
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	clock = [0.0]
+	monkeypatch.setattr(scheduler.time, 'perf_counter', lambda: clock[0])
+	ran = []
+	def task(i):
+		ran.append(i)
+		clock[0] += 0.005
+	for i in range(5):
+		tasks.submit(task, (i,), key=i)
+	root.idle.pop()()
+	# 8 ms budget, the task that goes over it still finishes
+	assert ran == [0, 1]
+	ms, run = root.later.pop()
+	assert ms == Scheduler.frame_interval
+	run()
+	assert ran == [0, 1, 2, 3]
+	root.later.pop()[1]()
+	assert ran == [0, 1, 2, 3, 4]
+	assert not root.later
+
+def test_resubmit_waits_for_next_frame():
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	ran = []
+	def task(i):
+		ran.append(i)
+		if i < 2:
+			tasks.submit(task, (i + 1,), key='again')
+	tasks.submit(task, (0,))
+	root.idle.pop()()
+	assert ran == [0]
+	assert root.idle == []
+	assert len(root.later) == 1
+	root.later.pop()[1]()
+	assert ran == [0, 1]
+	assert root.idle == []
+	root.later.pop()[1]()
+	assert ran == [0, 1, 2]
+	assert not root.idle and not root.later
+
+def test_exceptions_are_reported():
+	root = FakeRoot()
+	tasks = Scheduler.get(root)
+	ran = []
+	def fail():
+		raise RuntimeError('task failed')
+	tasks.submit(fail, priority=-1)
+	tasks.submit(ran.append, ('after',))
+	tasks.flush()
+	assert ran == ['after']
+	assert [str(error) for error in root.errors] == ['task failed']
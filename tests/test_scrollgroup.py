@@ -0,0 +1,159 @@
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+import pytest
+
+from tkwidgets.scrollgroup import ScrollGroup
+
+class FakeRoot(object):
+	def __init__(self):
+		self.idle = []
+		self.class_bindings = {}
+
+	def _root(self):
+		return self
+
+	def after_idle(self, func):
+		self.idle.append(func)
+
+	def after(self, ms, func):
+		self.idle.append(func)
+
+	def report_callback_exception(self, exc, value, tb):
+		raise value
+
+	def run(self):
+		while self.idle:
+			self.idle.pop(0)()
+
+class FakeView(tk.Misc):
+	'''a scrollable widget (or scrollbar) without a display, reports its
+	view through its scroll command when moved'''
+	def __init__(self, root, name):
+		self.root = root
+		self.name = name
+		self.options = {}
+		self.tags = (name, 'Fake', '.', 'all')
+		self.position = 0.0
+		self.alive = True
+		self.shown = None
+
+	def __str__(self):
+		return self.name
+
+	def _root(self):
+		return self.root
+
+	def configure(self, **options):
+		self.options.update(options)
+
+	def bind_class(self, tag, sequence, func):
+		self.root.class_bindings[tag, sequence] = func
+
+	def unbind_class(self, tag, sequence):
+		self.root.class_bindings.pop((tag, sequence), None)
+
+	def bindtags(self, tags=None):
+		if tags is None:
+			return self.tags
+		self.tags = tuple(tags)
+
+	def winfo_exists(self):
+		return self.alive
+
+	def yview(self, *args):
+		if not self.alive:
+			raise tk.TclError('invalid command name "%s"' % self.name)
+		if args:
+			self.position = float(args[1])
+			command = self.options.get('yscrollcommand')
+			if command:
+				self.root.after_idle(lambda: command(str(self.position), str(self.position + 0.5)))
+		return (self.position, self.position + 0.5)
+
+	def set(self, first, last):
+		if not self.alive:
+			raise tk.TclError('invalid command name "%s"' % self.name)
+		self.shown = (first, last)
+
+	def destroy(self):
+		self.alive = False
+		for (tag, sequence), func in list(self.root.class_bindings.items()):
+			if (sequence == '<Destroy>') and (tag in self.tags):
+				func(None)
+
+@pytest.fixture
+def root():
+	return FakeRoot()
+
+def group_of(root, *names):
+	group = ScrollGroup('vertical')
+	widgets = [FakeView(root, name) for name in names]
+	for widget in widgets:
+		group.add(widget)
+	bar = FakeView(root, 'bar')
+	group.add_scrollbar(bar)
+	return group, widgets, bar
+
+def test_members_follow(root):
+	group, (a, b, c), bar = group_of(root, 'a', 'b', 'c')
+	b.yview('moveto', 0.25)
+	root.run()
+	assert a.position == c.position == 0.25
+	assert bar.shown == ('0.25', '0.75')
+	assert not group._moved
+	group.view('moveto', 0.5)
+	root.run()
+	assert b.position == c.position == 0.5
+
+def test_destroyed_member_is_dropped(root):
+	group, (a, b), bar = group_of(root, 'a', 'b')
+	a.destroy()
+	assert group.members == [b]
+	assert a not in group._fractions
+	# view() used members[0], which was a
+	group.view('moveto', 0.5)
+	root.run()
+	assert b.position == 0.5
+	assert bar.shown == ('0.5', '1.0')
+	bar.destroy()
+	assert group.scrollbars == []
+	b.yview('moveto', 0.1)
+	root.run()
+
+def test_destroyed_while_sync_pending(root):
+	group, (a, b), bar = group_of(root, 'a', 'b')
+	a.yview('moveto', 0.25)
+	a.destroy()
+	root.run()
+	assert b.position == 0.0
+
+def test_remove(root):
+	group, (a, b), bar = group_of(root, 'a', 'b')
+	own = FakeView(root, 'own')
+	group.add(FakeView(root, 'c'), own)
+	c = group.members[-1]
+	tags = a.bindtags()
+	group.remove(a)
+	assert a.options['yscrollcommand'] == ''
+	assert a.bindtags() == tags[1:]
+	group.remove(c)
+	assert own not in group.scrollbars
+	assert c.options['yscrollcommand'] == own.set
+	assert own.options['command'] == c.yview
+	group.remove(bar)
+	assert bar.options['command'] == ''
+	a.yview('moveto', 0.5)
+	root.run()
+	assert group.members == [b]
+	assert b.position == 0.0
+	with pytest.raises(ValueError):
+		group.remove(a)
+	assert list(root.class_bindings) == [(group._tag(b), '<Destroy>')]
+
+def test_view_empty():
+	assert ScrollGroup('horizontal').view('moveto', 0) is None
+	with pytest.raises(ValueError):
+		ScrollGroup('diagonal')
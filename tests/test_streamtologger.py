@@ -0,0 +1,162 @@
+import atexit
+import logging
+import sys
+import threading
+import time
+import traceback
+
+import pytest
+
+from tkwidgets import debuglogger
+
+class ListHandler(logging.Handler):
+	def __init__(self):
+		logging.Handler.__init__(self)
+		self.messages = []
+
+	def emit(self, record):
+		self.messages.append(record.getMessage())
+
+@pytest.fixture(autouse=True)
+def no_atexit(monkeypatch):
+	monkeypatch.setattr(atexit, 'register', lambda *args: None)
+
+@pytest.fixture
+def stream():
+	logger = logging.getLogger('tests.streamtologger')
+	logger.propagate = False
+	logger.setLevel(logging.DEBUG)
+	handler = ListHandler()
+	logger.addHandler(handler)
+	stream = debuglogger.StreamToLogger(logger)
+	stream.errors = []
+	stream._error = lambda: stream.errors.append(stream.messages[-1])
+	stream.messages = handler.messages
+	yield stream
+	logger.removeHandler(handler)
+
+def raise_chained():
+	try:
+		{}['key']
+	except KeyError:
+		raise ValueError('bad value')
+
+def test_lines(stream):
+	stream.write('one')
+	stream.write(' two\nthree\n\nfour')
+	assert stream.messages == ['one two', 'three']
+	stream.flush()
+	assert stream.messages == ['one two', 'three', 'four']
+	assert stream.errors == []
+
+def test_traceback_is_one_record(stream):
+	try:
+		{}['key']
+	except KeyError:
+		# as report_callback_exception does, nothing follows and there is no flush
+		traceback.print_exc(file=stream)
+	assert len(stream.messages) == 1
+	assert stream.messages[0].startswith('Traceback (most recent call last):')
+	assert stream.messages[0].endswith("KeyError: 'key'")
+	assert stream.errors == [stream.messages[0]]
+	print('after', file=stream)
+	assert stream.messages[1:] == ['after']
+
+def test_chained_traceback_is_one_error(stream):
+	try:
+		raise_chained()
+	except ValueError:
+		stream.write(traceback.format_exc())
+	assert len(stream.messages) == 2
+	first, chained = stream.messages
+	assert first.startswith('Traceback (most recent call last):')
+	assert first.endswith("KeyError: 'key'")
+	assert chained.startswith('During handling of the above exception')
+	assert chained.count('Traceback (most recent call last):') == 1
+	assert chained.endswith('ValueError: bad value')
+	assert stream.errors == [first]
+	print('after', file=stream)
+	assert stream.messages[2:] == ['after']
+
+def test_error_types(stream):
+	stream.add_error_type(LookupError)
+	print('LookupError: missing', file=stream)
+	print('mymodule.LookupError', file=stream)
+	print('a LookupError happened', file=stream)
+	assert len(stream.errors) == 2
+
+@pytest.fixture
+def alerting(monkeypatch):
+	logger = logging.getLogger('tests.streamtologger.alerts')
+	logger.propagate = False
+	stream = debuglogger.StreamToLogger(logger)
+	stream.alerts = []
+	def alert(root=None):
+		stream._alert_id = None
+		stream._last_alert = time.time()
+		stream.alerts.append((root, stream._alert_count))
+		stream._alert_count = 0
+	stream._alert = alert
+	monkeypatch.setattr(debuglogger.tk, '_default_root', None, raising=False)
+	return stream
+
+class FakeRoot(object):
+	def __init__(self):
+		self.later = []
+
+	def after(self, ms, func, *args):
+		self.later.append((ms, func, args))
+		return 'after#%d' % len(self.later)
+
+def write_in_thread(stream, text):
+	thread = threading.Thread(target=stream.write, args=(text,))
+	thread.start()
+	thread.join()
+
+def test_alert_waits_for_main_thread(alerting):
+	write_in_thread(alerting, 'KeyError: one\n')
+	write_in_thread(alerting, 'KeyError: two\n')
+	assert alerting.alerts == []
+	alerting.write('not an error\n')
+	assert alerting.alerts == [(None, 2)]
+
+def test_alert_scheduled_on_root(alerting, monkeypatch):
+	root = FakeRoot()
+	monkeypatch.setattr(debuglogger.tk, '_default_root', root)
+	write_in_thread(alerting, 'KeyError: worker\n')
+	assert root.later == []
+	alerting.write('KeyError: main\n')
+	alerting.write('KeyError: again\n')
+	assert alerting.alerts == []
+	assert len(root.later) == 1
+	ms, func, args = root.later.pop()
+	assert ms == 0
+	func(*args)
+	assert alerting.alerts == [(root, 3)]
+
+def test_alert_interval(alerting):
+	alerting.write('KeyError: first\n')
+	alerting.write('KeyError: second\n')
+	assert alerting.alerts == [(None, 1)]
+	alerting._last_alert = 0
+	alerting.write('not an error\n')
+	assert alerting.alerts == [(None, 1), (None, 1)]
+
+def test_log_to_file_shutdown(tmp_path, monkeypatch):
+	monkeypatch.setattr(sys, 'stdout', sys.stdout)
+	monkeypatch.setattr(sys, 'stderr', sys.stderr)
+	root = logging.getLogger()
+	handlers, level = root.handlers[:], root.level
+	path = tmp_path / 'out.log'
+	try:
+		listener = debuglogger.log_to_file(str(path), capacity=1000, flush_interval=60)
+		print('first')
+		sys.stdout.write('partial')
+		sys.stdout.flush()
+		# what atexit runs, it must not raise and must write everything out
+		debuglogger._stop_listener(listener, listener.batch)
+	finally:
+		root.handlers[:] = handlers
+		root.setLevel(level)
+	lines = path.read_text().splitlines()
+	assert [line.rsplit(':', 1)[1] for line in lines] == ['first', 'partial']
@@ -0,0 +1,90 @@
+import io
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+import pytest
+
+from tkwidgets.tclprofile import TclProfiler
+
+class FakeWidget(tk.Misc):
+	'''a widget on a Tcl interpreter, no display needed'''
+	def __init__(self, master, name):
+		self.master = master
+		self.tk = master.tk
+		self.children = {}
+		self._w = '%s.%s' % (master._w.rstrip('.'), name)
+		master.children[name] = self
+
+	def set(self, value):
+		return self.tk.call('set', 'x', value)
+
+	def info(self):
+		return self.tk.call('info', 'exists', 'x')
+
+class Composite(object):
+	def __init__(self, root):
+		self.frame = FakeWidget(root, 'frame')
+		self.text = FakeWidget(self.frame, 'text')
+
+@pytest.fixture
+def root():
+	return tk.Tcl()
+
+def test_attach_detach(root):
+	child = FakeWidget(root, 'child')
+	tkapp = root.tk
+	with TclProfiler() as profiler:
+		profiler.attach(root, label='root')
+		later = FakeWidget(child, 'later') # inherits the recorder
+		child.set(1)
+		later.set(2)
+		later.info()
+	assert root.tk is child.tk is later.tk is tkapp
+	assert profiler.enabled is False
+	assert str(root.tk.call('set', 'x')) == '2'
+	calls = dict((key, calls) for key, calls, seconds in profiler.report(by=('method', 'command')))
+	assert calls == {('FakeWidget.set', 'set'): 2, ('FakeWidget.info', 'info'): 1}
+	child.set(3)
+	assert sum(calls for key, calls, seconds in profiler.report()) == 3
+
+def test_composite_attached_once(root):
+	composite = Composite(root)
+	tkapp = root.tk
+	profiler = TclProfiler()
+	assert len(profiler._widgets(composite)) == 2
+	profiler.attach(composite)
+	profiler.attach(composite.text, label='text')
+	assert len(profiler._attached) == 2
+	assert all(original is tkapp for widget, original in profiler._attached)
+	composite.text.set(1)
+	composite.frame.set(2)
+	widgets = sorted(key[0] for key in profiler.stats)
+	assert widgets == ['Composite %s' % composite, 'text']
+	profiler.detach()
+	assert composite.frame.tk is composite.text.tk is tkapp
+
+def test_report_grouping():
+	profiler = TclProfiler()
+	profiler.stats = {
+		('a', 'm1', 'set'): [2, 0.002],
+		('a', 'm2', 'set'): [1, 0.004],
+		('b', 'm1', 'info'): [5, 0.001],
+	}
+	assert profiler.report(by=('command',)) == [(('set',), 3, 0.006), (('info',), 5, 0.001)]
+	assert profiler.report(by=('widget', 'method'))[0] == (('a', 'm2'), 1, 0.004)
+	out = io.StringIO()
+	profiler.dump(by=('widget',), file=out, limit=1)
+	lines = out.getvalue().splitlines()
+	assert len(lines) == 2
+	assert lines[1].split() == ['3', '6.00', '2000.0', 'a']
+	profiler.reset()
+	assert profiler.report() == []
+
+def test_command_names():
+	assert TclProfiler._command(('.t', 'insert', 'end', 'x')) == 'insert'
+	assert TclProfiler._command((('winfo', 'width', '.t'),)) == 'winfo width'
+	assert TclProfiler._command(('set', 'a', '1')) == 'set'
+	assert TclProfiler._command(()) == ''
@@ -0,0 +1,39 @@
+'''
+A collection of widgets for python built on top of tkinter.
+Each widget's module is only imported the first time the widget is used,
+so importing one doesn't load what the others need.
+	from tkwidgets import ScrolledFrame
+'''
+import importlib
+
+# public name: submodule it is defined in
+_submodules = {
+	'ScrolledFrame': 'scrolledframe',
+	'MyScrollbar': 'customscrollbar',
+	'LinkScrolledText': 'linkscrolledtext',
+	'Debounce': 'debounce',
+	'DebounceTk': 'debounce',
+	'DebounceToplevel': 'debounce',
+	'DebounceFrame': 'debounce',
+	'DebugLogger': 'debuglogger',
+	'StreamToLogger': 'debuglogger',
+	'log_to_file': 'debuglogger',
+	'set_no_focus': 'tk_window_no_focus',
+	'TclProfiler': 'tclprofile',
+	'Scheduler': 'scheduler',
+	'ScrollGroup': 'scrollgroup',
+}
+
+__all__ = list(_submodules)
+
+def __getattr__(name):
+	try:
+		submodule = _submodules[name]
+	except KeyError:
+		raise AttributeError("module %r has no attribute %r" % (__name__, name))
+	value = getattr(importlib.import_module('.' + submodule, __name__), name)
+	globals()[name] = value # later lookups skip __getattr__
+	return value
+
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
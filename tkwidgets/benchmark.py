@@ -0,0 +1,176 @@
+'''
+Performance benchmarks for the widgets, run against a real display
+(under Xvfb on headless machines):
+	xvfb-run python -m tkwidgets.benchmark -o results.json
+	xvfb-run python -m tkwidgets.benchmark --compare results.json
+results are written as JSON, in compare mode each benchmark is checked
+against the stored baseline and the exit status is 1 if any got slower
+by more than the threshold.
+'''
+import argparse
+import json
+import platform
+import sys
+import time
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+from .customscrollbar import MyScrollbar
+from .debounce import DebounceFrame
+from .debuglogger import DebugLogger
+from .linkscrolledtext import LinkScrolledText
+from .scheduler import Scheduler
+from .scrolledframe import ScrolledFrame
+
+__all__ = ['BENCHMARKS', 'run', 'compare']
+
+# name: function(root, n) returning the seconds taken by the timed part
+BENCHMARKS = {}
+
+def benchmark(func):
+	BENCHMARKS[func.__name__] = func
+	return func
+
+@benchmark
+def scrolledframe_populate(root, n):
+	frame = ScrolledFrame(root, scrollbars='auto')
+	frame.pack(fill='both', expand=True)
+	root.update()
+	start = time.perf_counter()
+	for row in range(n):
+		tk.Label(frame, text='label %d' % row).grid(column=0, row=row)
+	root.update()
+	Scheduler.get(root).flush()
+	taken = time.perf_counter() - start
+	frame.destroy()
+	return taken
+
+@benchmark
+def scrollbar_set(root, n):
+	bar = MyScrollbar(root, command=None)
+	bar.pack(side='right', fill='y')
+	root.update()
+	start = time.perf_counter()
+	for i in range(n):
+		first = (i % 90) / 100.0
+		bar.set(first, first + 0.1)
+	Scheduler.get(root).flush()
+	root.update_idletasks()
+	taken = time.perf_counter() - start
+	bar.destroy()
+	return taken
+
+@benchmark
+def linkscrolledtext_links(root, n):
+	text = LinkScrolledText(root)
+	text.pack(fill='both', expand=True)
+	action = lambda: None
+	start = time.perf_counter()
+	for i in range(n):
+		text.insert_hyperlink('end', 'link %d\n' % i, action, tooltip='tip %d' % i)
+	# hover and click lookups on the links, spread through the text
+	for i in range(n):
+		text.mark_set('current', '%d.2' % (i + 1))
+		text._hyper._enter(None)
+		text._hyper._click(None)
+	root.update_idletasks()
+	taken = time.perf_counter() - start
+	text.frame.destroy()
+	return taken
+
+@benchmark
+def debuglogger_write(root, n):
+	logger = DebugLogger(maxsize=0)
+	start = time.perf_counter()
+	for i in range(n):
+		logger.stdout.write('line %d' % i)
+		logger.stdout.write('\n')
+	logger.flush()
+	root.update_idletasks()
+	taken = time.perf_counter() - start
+	logger.destroy()
+	return taken
+
+@benchmark
+def debounce_dispatch(root, n):
+	frame = DebounceFrame(root)
+	frame.bind('<KeyPress-a>', lambda event: None)
+	frame.bind('<KeyRelease-a>', lambda event: None)
+	press = tk.Event()
+	press.type, press.keysym, press.widget = '2', 'a', frame
+	release = tk.Event()
+	release.type, release.keysym, release.widget = '3', 'a', frame
+	start = time.perf_counter()
+	# auto repeat sends press and release pairs, then the real release
+	for i in range(n):
+		frame._on_key_press_repeat(press)
+		frame._on_key_release_repeat(release)
+		if i % 100 == 0:
+			frame.update()
+	frame.update()
+	taken = time.perf_counter() - start
+	frame.destroy()
+	return taken
+
+def run(n=1000, repeat=3, names=None):
+	'''run the benchmarks, best of repeat runs each, returns the results dict'''
+	root = tk.Tk()
+	root.geometry('400x300')
+	results = {}
+	try:
+		for name in (names or BENCHMARKS):
+			results[name] = min(BENCHMARKS[name](root, n) for i in range(repeat))
+	finally:
+		root.destroy()
+	return {'python': platform.python_version(),
+			'tk': str(tk.TkVersion),
+			'n': n,
+			'results': results}
+
+def compare(current, baseline, threshold=0.25):
+	'''returns [(name, baseline, current, ratio)] for benchmarks slower
+	than the baseline by more than threshold (a fraction)'''
+	regressions = []
+	for name, taken in current['results'].items():
+		base = baseline['results'].get(name)
+		if not base:
+			continue
+		ratio = taken / base
+		if ratio > 1 + threshold:
+			regressions.append((name, base, taken, ratio))
+	return regressions
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='benchmark the tkwidgets widgets')
+	parser.add_argument('-n', type=int, default=1000, help='operations per benchmark')
+	parser.add_argument('-r', '--repeat', type=int, default=3, help='runs of each, the best is kept')
+	parser.add_argument('-o', '--output', help='write the results to this JSON file')
+	parser.add_argument('--compare', metavar='BASELINE', help='JSON results to compare against')
+	parser.add_argument('--threshold', type=float, default=0.25,
+		help='allowed slowdown as a fraction of the baseline')
+	parser.add_argument('names', nargs='*', help='benchmarks to run (default all)')
+	args = parser.parse_args(argv)
+
+	current = run(args.n, args.repeat, args.names)
+	for name, taken in current['results'].items():
+		print('%-25s %10.2f ms' % (name, taken * 1000))
+	if args.output:
+		with open(args.output, 'w') as f:
+			json.dump(current, f, indent=2)
+	if args.compare:
+		with open(args.compare) as f:
+			baseline = json.load(f)
+		if baseline.get('n') != current['n']:
+			print('warning: baseline was run with n=%s' % baseline.get('n'))
+		regressions = compare(current, baseline, args.threshold)
+		for name, base, taken, ratio in regressions:
+			print('REGRESSION %-25s %.2f ms -> %.2f ms (x%.2f)' % (name, base * 1000, taken * 1000, ratio))
+		if regressions:
+			return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -1,5 +1,12 @@
 import tkinter as tk
 
+try:
+	from .scheduler import Scheduler
+except ImportError: # run as a script for the demo
+	from scheduler import Scheduler
+
+__all__ = ['MyScrollbar']
+
 ## To Do
 #	refactor to use _draw_element functions to create each element centered on a point (given as arg)
 #	refactor to calc constants on resize where possible
@@ -42,8 +49,10 @@ class MyScrollbar(tk.Canvas):
 		
 		self._sb_start = 0
 		self._sb_end = 1
+		self._thumb_size = None # size of the drawn thumb
 		
 		self.bind('<Configure>', self._resize)
+		self.bind('<Destroy>', self._cancel_draw)
 		self.tag_bind('button-1', '<Button-1>', self._button_1)
 		self.tag_bind('button-2', '<Button-1>', self._button_2)
 		self.tag_bind('trough', '<Button-1>', self._trough)
@@ -69,6 +78,15 @@ class MyScrollbar(tk.Canvas):
 			del kwargs[key]
 		return kwargs
 		
+	def configure(self, cnf=None, **kwargs):
+		# command can be changed after creation, like a tk scrollbar
+		if 'command' in kwargs:
+			self._scroll_kwargs['command'] = kwargs.pop('command')
+			if not (cnf or kwargs):
+				return
+		return tk.Canvas.configure(self, cnf, **kwargs)
+	config = configure
+		
 	def _get_colour(self, element):
 		if element in self._scroll_kwargs: # if element exists in settings
 			return self._scroll_kwargs[element]
@@ -142,7 +160,7 @@ class MyScrollbar(tk.Canvas):
 			outline = self._get_colour('troughoutline')
 			self.elements['trough'] = self.create_rectangle(rect, fill=fill, outline=outline, tag='trough')
 
-		self.set(self._sb_start, self._sb_end) # hacky way to redraw thumb without moving it
+		self._draw_thumb()
 		self.tag_raise('thumb') # ensure thumb always on top of trough
 			
 		self._oldwidth = width
@@ -241,19 +259,25 @@ class MyScrollbar(tk.Canvas):
 		
 	def set(self, *args):
 #		print('set: %s' % str(args))
-		oldsize = (self._sb_end - self._sb_start) / 1
-		
 		self._sb_start = float(args[0])
 		self._sb_end = float(args[1])
-		
+		# scrolling calls set many times a frame, only draw the last
+		Scheduler.get(self).submit(self._draw_thumb)
+		return 'break'
+
+	def _cancel_draw(self, event=None):
+		Scheduler.get(self).cancel(self._draw_thumb)
+
+	def _draw_thumb(self):
 		size = (self._sb_end - self._sb_start) / 1
 		
 		width = self._width()
 		height = self._height()
 		
-		if oldsize != size:
+		if self.elements['thumb'] and (self._thumb_size != size):
 			self.delete(self.elements['thumb'])
 			self.elements['thumb'] = None
+		self._thumb_size = size
 		
 		if (self._scroll_kwargs['orient'] == 'vertical'):
 			thumbrange = height - width
@@ -282,7 +306,6 @@ class MyScrollbar(tk.Canvas):
 			elif (self._scroll_kwargs['orient'] == 'horizontal'):
 				if (thumboffset != coords[1]):
 					self.move(self.elements['thumb'], thumboffset-coords[0], 0)
-		return 'break'
 		
 if __name__ == '__main__':
 	root = tk.Tk()
@@ -309,13 +332,17 @@ if __name__ == '__main__':
 	sbx2 = MyScrollbar(root, height=50, command=lb.xview, orient='horizontal', thumbtype='round')
 	sbx2.grid(column=1, row=4, sticky="nesw")
 	
-	def x_set(*args):
-		sbx1.set(*args)
-		sbx2.set(*args)
-		
-	def y_set(*args):
-		sby1.set(*args)
-		sby2.set(*args)
+	try:
+		from .scrollgroup import ScrollGroup
+	except ImportError:
+		from scrollgroup import ScrollGroup
+	xgroup = ScrollGroup('horizontal')
+	xgroup.add(lb)
+	xgroup.add_scrollbar(sbx1)
+	xgroup.add_scrollbar(sbx2)
 	
-	lb.configure(yscrollcommand=y_set, xscrollcommand=x_set)
+	ygroup = ScrollGroup('vertical')
+	ygroup.add(lb)
+	ygroup.add_scrollbar(sby1)
+	ygroup.add_scrollbar(sby2)
 	root.mainloop()
\ No newline at end of file
@@ -1,3 +1,5 @@
+import weakref
+
 try:
 	import tkinter as tk
 except ImportError:
@@ -20,9 +22,9 @@ class Debounce():
 			pass
 	'''
 	
-	# use classname as key to store class bindings
-	# as single dict for all instances
-	_bind_class_dict = {}
+	# use class as key to store class bindings
+	# as single dict for all instances, entries go with the class
+	_bind_class_dict = weakref.WeakKeyDictionary()
 	
 	# 'all' bindings stored here
 	# single dict for all instances
@@ -36,6 +38,8 @@ class Debounce():
 		self._debounce_init()
 		self._debounce_bind(event, function, debounce,
 			self._binding_dict, self._base.bind)
+		if event == '<Destroy>': # replaced the cleanup binding, add it back
+			self._base.bind(self, '<Destroy>', self._debounce_destroy, '+')
 			
 	def bind_all(self, event, function, debounce=True):
 		'''
@@ -44,24 +48,27 @@ class Debounce():
 		'''
 		self._debounce_init()
 		self._debounce_bind(event, function, debounce,
-			self._bind_all_dict, self._base.bind_all)
+			self._bind_all_dict, self._base.bind_all, shared=True)
 		
 	def bind_class(self, event, function, debounce=True):
 		'''
 		Override the bind_class method, acts as normal binding if not KeyPress or KeyRelease
 		type events, optional debounce parameter can be set to false to force normal behavior
-		unlike underlying tk bind_class this uses name of class on which its called
-		instead of requireing clas name as a parameter
+		unlike underlying tk bind_class this uses the class on which its called
+		instead of requireing clas name as a parameter, the bind tag is the module
+		and qualified name of the class so same named classes don't share bindings
 		'''
 		self._debounce_init()
 		self._debounce_bind(event, function, debounce,
-			self._bind_class_dict[self.__class__.__name__],
-			self._base.bind_class, self.__class__.__name__)
+			self._bind_class_dict[self.__class__],
+			self._base.bind_class, self._class_tag(self.__class__), shared=True)
 			
-	def _debounce_bind(self, event, function, debounce, bind_dict, bind_method, *args):
+	def _debounce_bind(self, event, function, debounce, bind_dict, bind_method, *args, **kwargs):
 		'''
-		internal method to implement binding
+		internal method to implement binding, class and all bindings are shared
+		so are bound to a handler that doesn't keep this instance alive
 		'''
+		shared = kwargs.get('shared', False)
 		self._debounce_init()
 		# remove special symbols and split at first hyphen if present
 		ev = event.replace("<", "").replace(">", "").split('-', 1)
@@ -77,14 +84,16 @@ class Debounce():
 				d = {'has_prev_key_release':None, 'has_prev_key_press':False}
 
 			# add function to dict (as keypress or release depending on name)
-			d[ev[0]] = function
+			d[ev[0]] = self._callback_ref(function)
 			# save binding back into dict
 			bind_dict[evname] = d
 			# call base class binding
 			if ev[0] == 'KeyPress':
-				bind_method(self, *args, sequence=event, func=self._on_key_press_repeat)
+				func = self._shared_handler('_on_key_press_repeat') if shared else self._on_key_press_repeat
+				bind_method(self, *args, sequence=event, func=func)
 			elif ev[0] == 'KeyRelease':
-				bind_method(self, *args, sequence=event, func=self._on_key_release_repeat)
+				func = self._shared_handler('_on_key_release_repeat') if shared else self._on_key_release_repeat
+				bind_method(self, *args, sequence=event, func=func)
 				
 		else: # not supported or not debounce, bind as normal
 			bind_method(self, *args, sequence=event, func=function)
@@ -98,22 +107,91 @@ class Debounce():
 					self._base = base
 					break
 		# for instance bindings
-		if not hasattr(self, '_binding_dict'):
-			self._binding_dict = {}
+		if hasattr(self, '_binding_dict'):
+			return # already set up
+		self._binding_dict = {}
+		# release timers this instance has queued
+		self._pending_releases = set()
 			
 		# for class bindings
 		try: # check if this class has alread had class bindings
-			cd = self._bind_class_dict[self.__class__.__name__]
+			cd = self._bind_class_dict[self.__class__]
 		except KeyError: # create dict to store if not
-			self._bind_class_dict[self.__class__.__name__] = {}
+			self._bind_class_dict[self.__class__] = {}
 			
 		# get the current bind tags
 		bindtags = list(self.bindtags())
 		# add our custom bind tag before the origional bind tag
 		index = bindtags.index(self._base.__name__)
-		bindtags.insert(index, self.__class__.__name__)
+		bindtags.insert(index, self._class_tag(self.__class__))
 		# save the bind tags back to the widget
 		self.bindtags(tuple(bindtags))
+		
+		self._base.bind(self, '<Destroy>', self._debounce_destroy, '+')
+		
+	@staticmethod
+	def _class_tag(cls):
+		'''
+		internal method, returns the bind tag for class bindings of cls
+		'''
+		return '%s.%s' % (cls.__module__, getattr(cls, '__qualname__', cls.__name__))
+		
+	def _debounce_destroy(self, event):
+		'''
+		internal method, cancels release timers this instance queued and drops
+		its bindings when it is destroyed
+		'''
+		if event.widget is not self:
+			return # destroy of a child reported through the toplevel's tag
+		for d in [self._binding_dict,
+			self._bind_class_dict.get(self.__class__, {}),
+			self._bind_all_dict]:
+			for evdict in d.values():
+				if evdict.get('has_prev_key_release') in self._pending_releases:
+					self.after_cancel(evdict['has_prev_key_release'])
+					evdict['has_prev_key_release'] = None
+		self._pending_releases.clear()
+		self._binding_dict.clear()
+		
+	def _callback_ref(self, function):
+		'''
+		internal method, methods of this widget are held weakly so the shared
+		class and all dicts don't keep it alive, like tk the binding goes with
+		the widget. other callables are held strongly, as tk's own bind does,
+		they may be the only reference to e.g. an App whose method is bound
+		'''
+		if getattr(function, '__self__', None) is self:
+			return weakref.WeakMethod(function)
+		return function
+			
+	@staticmethod
+	def _callback(evdict, name, event):
+		'''
+		internal method, calls the stored callback, unless it was a method of
+		a widget that has since gone
+		'''
+		func = evdict[name]
+		if isinstance(func, weakref.WeakMethod):
+			func = func()
+			if func is None:
+				return None
+		return func(event)
+		
+	def _shared_handler(self, name):
+		'''
+		internal method, returns a handler for class and all bindings that
+		calls method name of the widget the event is for, or of this instance
+		(held weakly) if that isn't a debounce widget
+		'''
+		ref = weakref.ref(self)
+		def handler(event):
+			widget = event.widget
+			if not (isinstance(widget, Debounce) and hasattr(widget, '_binding_dict')):
+				widget = ref()
+				if widget is None:
+					return None
+			return getattr(widget, name)(event)
+		return handler
 			
 	def _get_evdict(self, event):
 		'''
@@ -123,7 +201,7 @@ class Debounce():
 		names = {'2':'KeyPress', '3':'KeyRelease'}
 		# loop through all applicable bindings
 		for d in [self._binding_dict, # instance binding
-			self._bind_class_dict[self.__class__.__name__], # class
+			self._bind_class_dict[self.__class__], # class
 			self._bind_all_dict]: # all
 			evdict = None
 			generic = False
@@ -148,7 +226,8 @@ class Debounce():
 		# get all binding details
 		for d, evdict, generic in self._get_evdict(event):
 			# call callback
-			res = evdict['KeyRelease'](event)
+			res = self._callback(evdict, 'KeyRelease', event)
+			self._pending_releases.discard(evdict['has_prev_key_release'])
 			evdict['has_prev_key_release'] = None
 			
 			# record that key was released
@@ -169,9 +248,11 @@ class Debounce():
 			if evdict["has_prev_key_release"]:
 				# got a previous release so cancel it
 				self.after_cancel(evdict["has_prev_key_release"])
+				self._pending_releases.discard(evdict["has_prev_key_release"])
 				evdict["has_prev_key_release"] = None
 			# queue new event for key release
 			evdict["has_prev_key_release"] = self.after_idle(self._on_key_release, event)
+			self._pending_releases.add(evdict["has_prev_key_release"])
 		
 	def _on_key_press(self, event):
 		'''
@@ -181,7 +262,7 @@ class Debounce():
 		# get all binding details
 		for d, evdict, generic in self._get_evdict(event):
 			# call callback
-			res = evdict['KeyPress'](event)
+			res = self._callback(evdict, 'KeyPress', event)
 			# record that key was pressed
 			if generic:
 				evdict[event.keysym] = True
@@ -201,6 +282,7 @@ class Debounce():
 				if evdict["has_prev_key_release"]:
 					# got a previous release so cancel it
 					self.after_cancel(evdict["has_prev_key_release"])
+					self._pending_releases.discard(evdict["has_prev_key_release"])
 					evdict["has_prev_key_release"] = None
 				else:
 					# if not pressed before (real event)
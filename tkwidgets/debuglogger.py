@@ -0,0 +1,712 @@
+import atexit
+import collections
+import logging
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import tkinter as tk
+from tkinter.scrolledtext import ScrolledText
+
+try:
+	from .scheduler import Scheduler
+except ImportError: # run as a script for the demo
+	from scheduler import Scheduler
+
+__all__ = ["logging",
+		   "StreamToLogger",
+		   "log_to_file",
+		   "CaptureWriter",
+		   "CaptureReader",
+		   "Record",
+		   "DebugLogger"]
+ 
+class StreamToLogger(object):
+	"""A file like object that sends what is written to it to a logger.
+	writes are assembled into whole lines, each logged as one record,
+	except tracebacks which are logged as a single multi-line record as
+	soon as their exception line arrives. a chained traceback ("During
+	handling of the above exception...") that follows is logged as a
+	record of its own, counted as part of the same error.
+	partial lines are held until a newline, flush() or interpreter exit.
+	when a line matching one of error_types (names or exception classes)
+	is written a warning is shown, at most once per alert_interval seconds
+	with any errors in between counted into the next warning. warnings are
+	only shown from the main thread, scheduled on the root so the event
+	loop shows them, errors written by other threads wait for the next
+	write on the main thread, and anything still waiting is shown at exit.
+	"""
+	# minimum seconds between error warnings
+	alert_interval = 5
+
+	def __init__(self, logger, log_level=logging.INFO, error_types=()):
+		self.logger = logger
+		self.log_level = log_level
+		self.error_types = ["AssertionError", "AttributeError",
+							"EOFError", "FloatingPointError",
+							"GeneratorExit", "ImportError",
+							"IndexError", "KeyError",
+							"KeyboardInterrupt", "MemoryError",
+							"NameError", "NotImplementedError",
+							"OSError", "OverflowError",
+							"ReferenceError", "RuntimeError",
+							"StopIteration", "SyntaxError",
+							"IndentationError", "TabError",
+							"SystemError", #"SystemExit", #included for completeness, but illogical to log a normal exit
+							"TypeError", "UnboundLocalError",
+							"UnicodeError", "UnicodeEncodeError",
+							"UnicodeDecodeError", "UnicodeTranslateError",
+							"ValueError", "ZeroDivisionError",
+							"EnvironmentError", "IOError",
+							"WindowsError", "BlockingIOError",
+							"ChildProcessError", "ConnectionError",
+							"BrokenPipeError", "ConnectionAbortedError",
+							"ConnectionRefusedError", "ConnectionResetError",
+							"FileExistsError", "FileNotFoundError",
+							"InterruptedError", "IsADirectoryError",
+							"NotADirectoryError", "PermissionError",
+							"ProcessLookupError", "TimeoutError",]
+		self.error_types.extend(self._type_name(t) for t in error_types)
+		self._compile()
+		self._alert_count = 0
+		self._alert_id = None
+		self._last_alert = 0
+		self._partial = ""
+		self._traceback = []
+		self._traceback_state = None # 'body', 'ended' or 'chain' while in a traceback
+		self._chained = False # the traceback follows a chain message
+		self._lock = threading.RLock() # used as sys.stdout/stderr by any thread
+		# runs after flush at exit (atexit is last in first out)
+		atexit.register(self._exit_alert)
+		atexit.register(self.flush)
+
+	@staticmethod
+	def _type_name(error_type):
+		return getattr(error_type, "__name__", error_type)
+
+	def add_error_type(self, error_type):
+		"""add an exception class or name that should trigger a warning"""
+		self.error_types.append(self._type_name(error_type))
+		self._compile()
+
+	def _compile(self):
+		# longest first so the alternation prefers e.g. UnicodeDecodeError over UnicodeError
+		names = sorted(set(self.error_types), key=len, reverse=True)
+		# matches the final line of a traceback, optionally module qualified
+		self._error_re = re.compile(r"(?:[\w.]+\.)?(?:%s)(?::|\s*$)"
+			% "|".join(re.escape(name) for name in names))
+
+	def write(self, buf):
+		with self._lock:
+			self._partial += str(buf)
+			if "\n" not in self._partial:
+				return
+			lines = self._partial.split("\n")
+			self._partial = lines.pop()
+			for line in lines:
+				self._line(line.rstrip())
+		self._schedule_alert()
+
+	def _line(self, line):
+		state = self._traceback_state
+		if state == 'body':
+			self._traceback.append(line)
+			if line and not line[0].isspace(): # exception line ends this traceback
+				self._end_traceback()
+			return
+		if state == 'chain':
+			self._traceback.append(line)
+			if line.startswith("Traceback"):
+				self._traceback_state = 'body'
+			return
+		if state == 'ended':
+			# the traceback is already logged, a chained one may follow it
+			if not line:
+				return
+			if line.startswith(self._chain_messages):
+				self._traceback = [line]
+				self._traceback_state = 'chain'
+				self._chained = True
+				return
+			self._traceback_state = None
+		if line.startswith("Traceback (most recent call last):"):
+			self._traceback = [line]
+			self._traceback_state = 'body'
+			self._chained = False
+		elif line:
+			self._emit([line])
+
+	_chain_messages = ("During handling of the above exception",
+		"The above exception was the direct cause")
+
+	def _end_traceback(self):
+		lines = self._traceback
+		while lines and not lines[-1]:
+			lines.pop()
+		self._traceback = []
+		self._traceback_state = 'ended'
+		if lines:
+			# a chained traceback is the same error, already warned about
+			self._emit(lines, alert=not self._chained)
+
+	def _emit(self, lines, alert=True):
+		self.logger.log(self.log_level, "\n".join(lines))
+		if alert and self._error_re.match(lines[-1]):
+			self._error()
+
+	def _error(self):
+		self._alert_count += 1 # shown once the lock is released
+
+	def _schedule_alert(self):
+		if (not self._alert_count) or (self._alert_id is not None):
+			return # nothing to show, or already scheduled and this error will be included
+		if threading.current_thread() is not threading.main_thread():
+			return # Tk is only used from the main thread
+		root = getattr(tk, "_default_root", None)
+		wait = self._last_alert + self.alert_interval - time.time()
+		if root is not None:
+			# run by mainloop, or the application's own update() calls
+			self._alert_id = root.after(int(max(wait, 0) * 1000), self._alert, root)
+		elif wait <= 0:
+			self._alert()
+		# otherwise no window to schedule on, the next write or exit shows it
+
+	def _exit_alert(self):
+		# errors still waiting for their warning at exit are shown now
+		if self._alert_count:
+			self._alert(getattr(tk, "_default_root", None))
+
+	def _alert(self, root=None):
+		self._alert_id = None
+		self._last_alert = time.time()
+		with self._lock:
+			count, self._alert_count = self._alert_count, 0
+		if not count:
+			return
+		if count == 1:
+			message = "An error has occured,\ncheck error log"
+		else:
+			message = "%d errors have occured,\ncheck error log" % count
+		from tkinter import messagebox # only needed once something goes wrong
+		temporary = root is None
+		if temporary: # no application window to show it over
+			root = tk.Tk()
+			root.withdraw()
+		messagebox.showwarning("Warning", message, parent=root)
+		if temporary:
+			root.destroy()
+
+	def flush(self):
+		with self._lock:
+			if self._partial:
+				line, self._partial = self._partial, ""
+				self._line(line.rstrip())
+			if self._traceback:
+				self._end_traceback()
+		self._schedule_alert()
+
+def log_to_file(filename, level=logging.DEBUG,
+		format='%(asctime)s:%(levelname)s:%(name)s:%(message)s',
+		mode='w', max_bytes=0, backup_count=0, capacity=100, flush_interval=1.0):
+	"""Redirect stdout and stderr to a log file written by a background thread.
+	the calling thread only puts records on a queue, a QueueListener writes
+	them to the file capacity records at a time (errors straight away),
+	or whatever is buffered once flush_interval seconds have passed.
+	if max_bytes is given the file is rotated at that size keeping
+	backup_count old files. the listener is stopped and everything written
+	out at exit. returns the QueueListener.
+	"""
+	import logging.handlers
+	_TimedMemoryHandler, _BatchListener = _load_handlers()
+	handler = logging.handlers.RotatingFileHandler(filename, mode,
+		max_bytes, backup_count, delay=True)
+	handler.setFormatter(logging.Formatter(format))
+	batch = _TimedMemoryHandler(capacity, logging.ERROR, handler, flush_interval)
+	log_queue = queue.Queue()
+	listener = _BatchListener(log_queue, batch)
+	root = logging.getLogger()
+	root.setLevel(level)
+	root.addHandler(logging.handlers.QueueHandler(log_queue))
+	listener.start()
+	# registered before the streams so their flush at exit runs first
+	atexit.register(_stop_listener, listener, batch)
+	sys.stdout = StreamToLogger(logging.getLogger('STDOUT'), logging.INFO)
+	sys.stderr = StreamToLogger(logging.getLogger('STDERR'), logging.ERROR)
+	return listener
+
+def _stop_listener(listener, batch):
+	listener.stop()
+	target = batch.target # close() clears it
+	batch.close()
+	target.close()
+
+_handlers = None
+
+def _load_handlers():
+	# logging.handlers (and socket with it) is only imported by log_to_file
+	global _handlers
+	if _handlers is None:
+		import logging.handlers
+		class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+			"""MemoryHandler that also flushes once interval seconds have passed"""
+			def __init__(self, capacity, flushLevel, target, interval):
+				logging.handlers.MemoryHandler.__init__(self, capacity, flushLevel, target)
+				self.interval = interval
+				self._flushed = time.time()
+
+			def shouldFlush(self, record):
+				return (logging.handlers.MemoryHandler.shouldFlush(self, record) or
+					(time.time() - self._flushed >= self.interval))
+
+			def flush(self):
+				logging.handlers.MemoryHandler.flush(self)
+				self._flushed = time.time()
+
+		class _BatchListener(logging.handlers.QueueListener):
+			"""QueueListener that flushes its batch handler while the queue is idle"""
+			def __init__(self, queue, batch):
+				logging.handlers.QueueListener.__init__(self, queue, batch)
+				self.batch = batch
+
+			def dequeue(self, block):
+				while True:
+					try:
+						return self.queue.get(block, self.batch.interval if block else None)
+					except queue.Empty:
+						if not block:
+							raise
+						self.batch.flush()
+
+		_handlers = (_TimedMemoryHandler, _BatchListener)
+	return _handlers
+
+class StdOut(object):
+	def __init__(self, parent):
+		self.parent = parent
+	def write(self, buf):
+		self.parent.write(buf, 'stdout')
+	def flush(self):
+		self.parent.flush()
+		
+class StdErr(object):
+	def __init__(self, parent):
+		self.parent = parent
+	def write(self, buf):
+		self.parent.write(buf, 'stderr')
+	def flush(self):
+		self.parent.flush()
+
+_CAPTURE_MAGIC = b"TKDLCAP1"
+# sync marker, time, stream id, payload length
+_CAPTURE_HEADER = None
+# payload length again so the file can be read backwards
+_CAPTURE_TRAILER = None
+_CAPTURE_SYNC = b"\x1e\x1f"
+_CAPTURE_STREAMS = {'stdout': 1, 'stderr': 2}
+_CAPTURE_STREAM_NAMES = {1: 'stdout', 2: 'stderr'}
+
+def _load_capture_format():
+	# struct is only imported once a capture file is used
+	global _CAPTURE_HEADER, _CAPTURE_TRAILER
+	if _CAPTURE_HEADER is None:
+		import struct
+		_CAPTURE_HEADER = struct.Struct("<2sdBI")
+		_CAPTURE_TRAILER = struct.Struct("<I")
+
+class CaptureWriter(object):
+	"""Appends stdout/stderr writes to a binary capture file.
+	each record holds the time, stream and utf-8 text of one write,
+	written through a buffered file. stderr writes flush the buffer so
+	a traceback is on disk before the program dies.
+	can be used directly as the parent of StdOut and StdErr.
+	"""
+	def __init__(self, path, buffering=65536):
+		_load_capture_format()
+		self._file = open(path, "ab", buffering)
+		self._lock = threading.Lock()
+		if self._file.tell() == 0:
+			self._file.write(_CAPTURE_MAGIC)
+		atexit.register(self.close)
+
+	def write(self, buf, type, when=None):
+		payload = str(buf).encode("utf-8", "backslashreplace")
+		stream = _CAPTURE_STREAMS.get(type, 0)
+		record = (_CAPTURE_HEADER.pack(_CAPTURE_SYNC, when or time.time(), stream, len(payload))
+			+ payload + _CAPTURE_TRAILER.pack(len(payload)))
+		with self._lock:
+			if self._file.closed:
+				return
+			self._file.write(record)
+			if type == 'stderr':
+				self._file.flush()
+
+	def flush(self):
+		with self._lock:
+			if not self._file.closed:
+				self._file.flush()
+
+	def close(self):
+		with self._lock:
+			self._file.close()
+
+class CaptureReader(object):
+	"""Reads a capture file written by CaptureWriter through mmap,
+	tail() reads backwards from the end so its cost does not depend on
+	the size of the file. records torn by a crash are skipped, including
+	ones in the middle of a file that was appended to afterwards.
+	"""
+	def __init__(self, path):
+		import mmap
+		_load_capture_format()
+		self._file = open(path, "rb")
+		size = os.fstat(self._file.fileno()).st_size
+		self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+		if self._map[:len(_CAPTURE_MAGIC)] not in (_CAPTURE_MAGIC, b""):
+			self.close()
+			raise ValueError("%s is not a capture file" % path)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def close(self):
+		if not isinstance(self._map, bytes): # empty files aren't mapped
+			self._map.close()
+		self._file.close()
+
+	def _record(self, start, end):
+		"""returns the record at start if it is whole and finishes at end"""
+		if (start < len(_CAPTURE_MAGIC) or (start + _CAPTURE_HEADER.size > end) or
+				(end > len(self._map))):
+			return None
+		sync, when, stream, length = _CAPTURE_HEADER.unpack_from(self._map, start)
+		payload = start + _CAPTURE_HEADER.size
+		if ((sync != _CAPTURE_SYNC) or (payload + length + _CAPTURE_TRAILER.size != end) or
+				(_CAPTURE_TRAILER.unpack_from(self._map, payload + length)[0] != length)):
+			return None
+		text = self._map[payload:payload + length].decode("utf-8", "replace")
+		return (text, _CAPTURE_STREAM_NAMES.get(stream, 'stdout'), when)
+
+	def _record_end(self, start):
+		# end of the record starting at start, from its header
+		length = _CAPTURE_HEADER.unpack_from(self._map, start)[3]
+		return start + _CAPTURE_HEADER.size + length + _CAPTURE_TRAILER.size
+
+	def tail(self, count):
+		"""returns the last count records as (text, stream, time), oldest first"""
+		records = []
+		end = len(self._map)
+		while (len(records) < count) and (end > len(_CAPTURE_MAGIC)):
+			length = _CAPTURE_TRAILER.unpack_from(self._map, end - _CAPTURE_TRAILER.size)[0]
+			start = end - _CAPTURE_TRAILER.size - length - _CAPTURE_HEADER.size
+			record = self._record(start, end)
+			if record:
+				records.append(record)
+				end = start
+				continue
+			# torn or garbled, step back to the previous sync marker that starts a whole record
+			start = self._map.rfind(_CAPTURE_SYNC, len(_CAPTURE_MAGIC), end - 1)
+			while start != -1:
+				if start + _CAPTURE_HEADER.size <= end:
+					record_end = self._record_end(start)
+					if (record_end <= end) and self._record(start, record_end):
+						break
+				start = self._map.rfind(_CAPTURE_SYNC, len(_CAPTURE_MAGIC), start)
+			if start == -1:
+				break
+			end = record_end
+		records.reverse()
+		return records
+
+	def __iter__(self):
+		"""yields every record as (text, stream, time), oldest first"""
+		start = len(_CAPTURE_MAGIC)
+		while start + _CAPTURE_HEADER.size <= len(self._map):
+			end = self._record_end(start)
+			record = self._record(start, end)
+			if record is None:
+				# torn by a crash before the file was appended to again, skip to the next record
+				start = self._map.find(_CAPTURE_SYNC, start + 1)
+				if start == -1:
+					return
+				continue
+			yield record
+			start = end
+
+# one line (or the partial last line) of console output
+Record = collections.namedtuple("Record", "offset stream level time text")
+
+class DebugLogger(object):
+	"""An on screen console for stdout and stderr.
+	write may be called from any thread, text is queued and the tk thread
+	drains the queue every flush_interval ms, adding everything queued
+	with a single insert. when the queue is full writes from other threads
+	are dropped (and counted) unless block is True, in which case they wait
+	for the tk thread to catch up.
+	every line is kept in an index of Records (offset in the output,
+	stream, level, time written and text) so set_filter and search work
+	from the index rather than the textbox.
+	if max_lines is given the oldest lines are deleted in chunks of
+	trim_chunk lines (default a tenth of max_lines) once the console holds
+	max_lines + trim_chunk lines, optionally appending them to the file
+	named by spill (as utf-8) so nothing is lost.
+	if capture is given every write is also appended to that capture file
+	(see CaptureWriter) as it happens, load_capture shows the tail of one.
+	if highlight is True levels, timestamps and tracebacks are coloured,
+	but only on the lines on screen (plus highlight_margin either side),
+	redone when the view scrolls so the number of tags stays constant.
+	"""
+	# the queue is drained and added to the textbox every this many ms
+	flush_interval = 16
+	# first level name found in a line sets its level
+	_level_re = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+	_default_level = {'stdout': logging.INFO, 'stderr': logging.ERROR}
+	# lines above and below the visible ones that are also highlighted
+	highlight_margin = 50
+	_timestamp_re = re.compile(r"(?:\d{4}-\d\d-\d\d[ T])?\d\d:\d\d:\d\d(?:[.,]\d+)?")
+	_traceback_re = re.compile(r"Traceback \(most recent call last\):|  File \"")
+	_highlight_tags = {'DEBUG': {'foreground': 'grey'},
+					   'INFO': {'foreground': 'dark green'},
+					   'WARNING': {'foreground': 'dark orange'},
+					   'ERROR': {'foreground': 'red'},
+					   'CRITICAL': {'foreground': 'white', 'background': 'red'},
+					   'timestamp': {'foreground': 'grey'},
+					   'traceback': {'background': '#ffe8e8'}}
+
+	def __init__(self, maxsize=10000, block=False, max_lines=None,
+			trim_chunk=None, spill=None, highlight=False, capture=None):
+		self.GUI = tk.Toplevel()
+		self.GUI.protocol('WM_DELETE_WINDOW', self.GUI.withdraw)
+		self.GUI.title("Debug Console")
+
+		self.textbox = ScrolledText(self.GUI)
+		self.textbox.configure(state = "disabled")
+		self.textbox.pack(fill = "both", expand = True)
+		self.textbox.tag_config('stdout', foreground='blue')
+		self.textbox.tag_config('stderr', foreground='red')
+		self.GUI.focus()
+		self.stdout = StdOut(self)
+		self.stderr = StdErr(self)
+
+		self.block = block
+		self.dropped = 0 # total writes dropped because the queue was full
+		self._queue = queue.Queue(maxsize)
+		self._thread = threading.current_thread()
+		self._dropped_lock = threading.Lock()
+		self._dropped = 0 # dropped since last flush
+
+		self.records = collections.deque()
+		self._offset = 0
+		self._streams = None
+		self._level = 0
+		self._pattern = None
+
+		self.max_lines = max_lines
+		self.trim_chunk = trim_chunk or max(1, (max_lines or 0) // 10)
+		self.spill = spill
+		self.trimmed = 0 # total lines removed from the top of the console
+
+		self.capture = CaptureWriter(capture) if capture else None
+
+		if highlight:
+			for tag, options in self._highlight_tags.items():
+				self.textbox.tag_config(tag, **options)
+			self.textbox.configure(yscrollcommand=self._yscroll)
+		self._poll()
+
+	def write(self, buf, type):
+		item = (str(buf), type, time.time())
+		if self.capture:
+			self.capture.write(*item)
+		if threading.current_thread() is self._thread:
+			# never block the tk thread, make room instead
+			try:
+				self._queue.put_nowait(item)
+			except queue.Full:
+				self.flush()
+				self._queue.put_nowait(item)
+			return
+		try:
+			self._queue.put(item, self.block)
+		except queue.Full:
+			with self._dropped_lock:
+				self._dropped += 1
+				self.dropped += 1
+
+	def _poll(self):
+		# scheduled first so an error adding text (reported through this queue) doesn't stop it
+		self._poll_id = self.textbox.after(self.flush_interval, self._poll)
+		self.flush()
+
+	def destroy(self):
+		"""stop draining the queue and destroy the window"""
+		self.textbox.after_cancel(self._poll_id)
+		Scheduler.get(self.textbox).cancel(self._highlight)
+		self.GUI.destroy()
+
+	def flush(self):
+		if threading.current_thread() is not self._thread:
+			return # only the tk thread may touch the textbox, it drains on its next poll
+		buffer = []
+		try:
+			while True:
+				buffer.append(self._queue.get_nowait())
+		except queue.Empty:
+			pass
+		with self._dropped_lock:
+			dropped, self._dropped = self._dropped, 0
+		if dropped:
+			buffer.append(("[%d writes dropped]\n" % dropped, 'stderr', time.time()))
+		if buffer:
+			self._add(buffer)
+
+	def _add(self, items):
+		"""index and display (text, stream, time) items, on the tk thread"""
+		args = []
+		for buf, type, when in items:
+			for line in buf.splitlines(True):
+				shown = self._index(line, type, when)
+				if shown:
+					self._add_arg(args, shown, type)
+		if args:
+			self.textbox.configure(state = "normal")
+			self.textbox.insert(tk.END, *args)
+			self.textbox.configure(state = "disabled")
+			self.textbox.see("end")
+		if self.max_lines and (len(self.records) > self.max_lines + self.trim_chunk):
+			self._trim()
+
+	@staticmethod
+	def _add_arg(args, text, type):
+		# merge consecutive fragments with the same tag so they are one insert
+		if args and args[-1] == type:
+			args[-2] += text
+		else:
+			args += [text, type]
+
+	def _index(self, text, type, when):
+		"""add text (at most one line) to the index, returns the text to add
+		to the textbox, which may include earlier parts of the line, or None"""
+		last = self.records[-1] if self.records else None
+		if last and (last.stream == type) and not last.text.endswith("\n"):
+			# continues a partial line, level and visibility are decided on the whole line
+			record = last._replace(text=last.text + text,
+				level=self._classify(last.text + text, type))
+			self.records[-1] = record
+			self._offset += len(text)
+			if self._shown(last):
+				return text
+			return record.text if self._shown(record) else None
+		record = Record(self._offset, type, self._classify(text, type), when, text)
+		self.records.append(record)
+		self._offset += len(text)
+		return text if self._shown(record) else None
+
+	def _classify(self, text, type):
+		match = self._level_re.search(text)
+		return logging.getLevelName(match.group(1)) if match else self._default_level.get(type, 0)
+
+	def _filtered(self):
+		return (self._streams is not None) or self._level or (self._pattern is not None)
+
+	def _visible(self, record):
+		return (((self._streams is None) or (record.stream in self._streams)) and
+			(record.level >= self._level) and
+			((self._pattern is None) or (self._pattern.search(record.text) is not None)))
+
+	def _shown(self, record):
+		# while filtering, partial lines wait until they are complete
+		return self._visible(record) and (record.text.endswith("\n") or not self._filtered())
+
+	def _trim(self):
+		count = len(self.records) - self.max_lines
+		removed = [self.records.popleft() for i in range(count)]
+		if self.spill:
+			with open(self.spill, "a", encoding="utf-8", errors="replace") as f:
+				f.write("".join(record.text for record in removed))
+		lines = sum(record.text.count("\n") for record in removed if self._shown(record))
+		if lines:
+			self.textbox.configure(state = "normal")
+			self.textbox.delete("1.0", "%d.0" % (lines + 1))
+			self.textbox.configure(state = "disabled")
+		self.trimmed += count
+		self.GUI.title("Debug Console (%d lines trimmed)" % self.trimmed)
+
+	def _yscroll(self, first, last):
+		self.textbox.vbar.set(first, last)
+		# cosmetic, so runs after layout and scrollbar work
+		Scheduler.get(self.textbox).submit(self._highlight, priority=10)
+
+	def _highlight(self):
+		first = int(self.textbox.index("@0,0").split(".")[0])
+		last = int(self.textbox.index("@0,%d" % self.textbox.winfo_height()).split(".")[0])
+		start = max(1, first - self.highlight_margin)
+		end = last + self.highlight_margin + 1
+		text = self.textbox.get("%d.0" % start, "%d.0" % end)
+		ranges = dict((tag, []) for tag in self._highlight_tags)
+		for line, chars in enumerate(text.split("\n"), start):
+			for regex, name in ((self._level_re, None), (self._timestamp_re, 'timestamp')):
+				for match in regex.finditer(chars):
+					ranges[name or match.group(1)] += ["%d.%d" % (line, match.start()),
+						"%d.%d" % (line, match.end())]
+			if self._traceback_re.match(chars):
+				ranges['traceback'] += ["%d.0" % line, "%d.end" % line]
+		# drop tags from lines that scrolled away, then one add per tag
+		for tag, indices in ranges.items():
+			self.textbox.tag_remove(tag, "1.0", tk.END)
+			if indices:
+				self.textbox.tag_add(tag, *indices)
+
+	def load_capture(self, path, count=1000):
+		"""show the last count records of a capture file"""
+		with CaptureReader(path) as reader:
+			self._add(reader.tail(count))
+
+	def search(self, pattern, flags=0):
+		"""return the indexed Records whose text matches the regex pattern"""
+		regex = re.compile(pattern, flags)
+		return [record for record in self.records if regex.search(record.text)]
+
+	def set_filter(self, streams=None, level=0, pattern=None, flags=0):
+		"""show only lines from the given streams ('stdout', 'stderr'),
+		at or above level, and matching the regex pattern.
+		the textbox is rebuilt from the index with a single insert.
+		"""
+		self.flush()
+		self._streams = None if streams is None else set(streams)
+		self._level = logging.getLevelName(level) if isinstance(level, str) else level
+		self._pattern = None if pattern is None else re.compile(pattern, flags)
+		args = []
+		for record in self.records:
+			if self._shown(record):
+				self._add_arg(args, record.text, record.stream)
+		self.textbox.configure(state = "normal")
+		self.textbox.delete("1.0", tk.END)
+		if args:
+			self.textbox.insert(tk.END, *args)
+		self.textbox.configure(state = "disabled")
+		self.textbox.see("end")
+
+	def clear_filter(self):
+		"""show all lines again"""
+		self.set_filter()
+
+if __name__ == '__main__':
+	import os, sys
+	sys.argv.append('-d')
+	if ("-d" in sys.argv) or ("-D" in sys.argv):
+		debugger = DebugLogger()
+		sys.stdout = debugger.stdout
+		sys.stderr = debugger.stderr
+	else:
+		logdir = os.getenv("APPDATA") + "\\applicationame\\"
+		if not os.path.isdir(logdir):
+			os.makedirs(logdir)
+		logfile = logdir + "applicationname.log"
+		log_to_file(logfile, max_bytes=1000000, backup_count=3)
+	print("test")
+	raise(Error)
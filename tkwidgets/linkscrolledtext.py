@@ -2,8 +2,10 @@
 __all__ = ["LinkScrolledText"]
 
 try:
+	import tkinter as tk
 	from tkinter import scrolledtext
 except ImportError:
+	import Tkinter as tk
 	import ScrolledText as scrolledtext
 	
 class HyperlinkManager(object):
@@ -22,19 +24,80 @@ class HyperlinkManager(object):
 		self.text.tag_bind("hyper", "<Enter>", self._enter)
 		self.text.tag_bind("hyper", "<Leave>", self._leave)
 		self.text.tag_bind("hyper", "<Button-1>", self._click)
+		self.registry = {}
 		self.reset()
 
 	def reset(self):
 		self.links = {}
 
+	def register(self, key, action):
+		"""Registers an action under a key.
+		links added with the key as their action resolve it when clicked,
+		and are saved by key when the content is dumped.
+		"""
+		self.registry[key] = action
+
 	def add(self, action, tooltip=None):
 		"""Adds an action to the manager.
-		:param action: A func to call.
+		:param action: A func to call, or a key registered with register().
 		:return: A clickable tag to use in the text widget.
 		"""
 		tag = "hyper-%d" % len(self.links)
 		self.links[tag] = [action, tooltip]
-		return ("hyper", tag)
+		return ["hyper", tag]
+
+	def _action_key(self, action):
+		if not callable(action): # already a key, or None
+			return action
+		for key, func in self.registry.items():
+			if func is action:
+				return key
+		raise ValueError("link action %r is not registered, "
+			"register() it to dump the content" % (action,))
+
+	def dump(self):
+		"""Returns the text, tag ranges and links of the widget
+		as a dict of plain types suitable for json or pickle.
+		raises ValueError if a link's action is a callable that
+		wasn't registered, as it can't be saved.
+		"""
+		tags = {}
+		for tag in self.text.tag_names():
+			if tag == "sel":
+				continue
+			ranges = self.text.tag_ranges(tag)
+			if ranges:
+				tags[tag] = [str(index) for index in ranges]
+		keys = {}
+		links = {}
+		for tag, (action, tooltip) in self.links.items():
+			if action not in keys:
+				keys[action] = self._action_key(action)
+			links[tag] = [keys[action], tooltip]
+		return {"text": self.text.get("1.0", "end-1c"),
+				"tags": tags,
+				"links": links}
+
+	def load(self, data):
+		"""Replaces the widget content with that returned by dump().
+		the text is inserted in one go and each tag added with a single call.
+		a disabled widget is enabled while it is filled.
+		"""
+		state = self.text.cget("state")
+		self.text.configure(state="normal")
+		try:
+			self.text.delete("1.0", "end")
+			self.text.insert("1.0", data["text"])
+			for tag, ranges in data["tags"].items():
+				self.text.tag_add(tag, *ranges)
+		finally:
+			self.text.configure(state=state)
+		self.links = dict((tag, list(link)) for tag, link in data["links"].items())
+
+	def _resolve(self, action):
+		if callable(action):
+			return action
+		return self.registry.get(action)
 
 	def _enter(self, event):
 		self.text.config(cursor="hand2")
@@ -53,7 +116,7 @@ class HyperlinkManager(object):
 	def _click(self, event):
 		for tag in self.text.tag_names(tk.CURRENT):
 			if (tag[:6] == "hyper-"):
-				func = self.links[tag][0]
+				func = self._resolve(self.links[tag][0])
 				if func:
 					func()
 				return
@@ -80,6 +143,21 @@ class LinkScrolledText(scrolledtext.ScrolledText):
 
 	def reset_links(self):
 		self._hyper.reset()
+
+	def register_action(self, key, action):
+		"""register an action so links using it can be saved and restored"""
+		self._hyper.register(key, action)
+
+	def dump_content(self):
+		"""return the text, tags and links as a dict that can be stored,
+		link actions are saved by their registered key, a ValueError
+		is raised for an action that wasn't registered
+		"""
+		return self._hyper.dump()
+
+	def load_content(self, data):
+		"""restore content previously returned by dump_content"""
+		self._hyper.load(data)
 		
 	def insert_hyperlink(self, position, text, action, tag=None, tooltip=None):
 		tags = self._hyper.add(action, tooltip)
@@ -90,10 +168,6 @@ class LinkScrolledText(scrolledtext.ScrolledText):
 		self.insert(position, text, tags)
 
 if __name__ == "__main__":
-	try:
-		import tkinter as tk
-	except ImportError:
-		import Tkinter as tk
 	root = tk.Tk()
 	tb = LinkScrolledText(root)
 	tb.pack(fill="both", expand=True)
@@ -0,0 +1,90 @@
+'''
+A cooperative scheduler for deferred widget work, one per Tcl interpreter.
+	Scheduler.get(widget).submit(widget.redraw)
+tasks are keyed (by default on the function, so the same bound method
+submitted twice runs once) and run lowest priority first, in the order
+they were first submitted, until the frame budget is used up. anything
+left runs in the following frames.
+'''
+import itertools
+import sys
+import time
+
+__all__ = ['Scheduler']
+
+class Scheduler(object):
+	# ms between frames when work is carried over
+	frame_interval = 16
+	# ms of tasks run per frame, at least one task always runs
+	budget = 8
+
+	@classmethod
+	def get(cls, widget):
+		'''returns the scheduler for the interpreter widget belongs to'''
+		root = widget._root()
+		try:
+			return root._tkwidgets_scheduler
+		except AttributeError:
+			root._tkwidgets_scheduler = cls(root)
+			return root._tkwidgets_scheduler
+
+	def __init__(self, root):
+		self.root = root
+		# key: [priority, sequence, func, args]
+		self._tasks = {}
+		self._sequence = itertools.count()
+		self._after_id = None
+
+	def submit(self, func, args=(), key=None, priority=0):
+		'''
+		run func(*args) in a later frame, if a task with the same key is
+		already waiting it is replaced by this one, keeping its place and
+		the more urgent (lower) priority
+		'''
+		if key is None:
+			key = func
+		task = self._tasks.get(key)
+		if task:
+			task[0] = min(task[0], priority)
+			task[2:] = [func, args]
+		else:
+			self._tasks[key] = [priority, next(self._sequence), func, args]
+		if self._after_id is None:
+			# first frame runs once pending events are handled, so a burst coalesces
+			self._after_id = self.root.after_idle(self._run)
+
+	def cancel(self, key):
+		'''drop the waiting task with key, if any'''
+		self._tasks.pop(key, None)
+
+	def pending(self, key):
+		return key in self._tasks
+
+	def _run(self):
+		# the id stays set while tasks run, so tasks they submit wait for the next frame
+		try:
+			self.run(self.budget)
+		finally:
+			self._after_id = None
+			if self._tasks:
+				self._after_id = self.root.after(self.frame_interval, self._run)
+
+	def run(self, budget=None):
+		'''run waiting tasks in order, for at most budget ms (default all of them)'''
+		deadline = None if budget is None else time.perf_counter() + budget / 1000.0
+		# tasks submitted while running wait for the next frame
+		order = sorted(self._tasks.items(), key=lambda item: item[1][:2])
+		for key, task in order:
+			if self._tasks.get(key) is not task:
+				continue # cancelled by an earlier task
+			del self._tasks[key]
+			try:
+				task[2](*task[3])
+			except Exception:
+				self.root.report_callback_exception(*sys.exc_info())
+			if (deadline is not None) and (time.perf_counter() >= deadline):
+				break
+
+	def flush(self):
+		'''run everything waiting now'''
+		self.run()
@@ -5,6 +5,10 @@ except ImportError:
     import Tkinter as tk
     import ttk
 
+try:
+    from .scheduler import Scheduler
+except ImportError: # run as a script for the demo
+    from scheduler import Scheduler
 
 __all__ = ['ScrolledFrame']
 
@@ -37,14 +41,15 @@ class ScrolledFrame:
         self.canvas.xview_moveto(0)
         self.canvas.yview_moveto(0)
 
-        self.canvas.bind('<Configure>', self._reconfigure)
+        self.canvas.bind('<Configure>', self._schedule_reconfigure)
 
         self.frame = tk.Frame(self.canvas)
 
         self.frame_id = self.canvas.create_window(
             0, 0, window=self.frame, anchor='nw')
 
-        self.frame.bind('<Configure>', self._reconfigure)
+        self.frame.bind('<Configure>', self._schedule_reconfigure)
+        self.outer_frame.bind('<Destroy>', self._cancel_reconfigure)
 
         self.canvas.bind("<Enter>", self._bind_events)
         self.canvas.bind("<Leave>", self._unbind_events)
@@ -71,6 +76,13 @@ class ScrolledFrame:
     def __repr__(self):
         return str(self.outer_frame)
 
+    def _schedule_reconfigure(self, event=None):
+        # configure events come in bursts, lay out once per frame
+        Scheduler.get(self.outer_frame).submit(self._reconfigure)
+
+    def _cancel_reconfigure(self, event=None):
+        Scheduler.get(self.outer_frame).cancel(self._reconfigure)
+
     def _reconfigure(self, event=None):
         self.update_idletasks()
         f_reqsize = (self.frame.winfo_reqwidth(), self.frame.winfo_reqheight())
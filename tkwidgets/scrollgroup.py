@@ -0,0 +1,148 @@
+'''
+Keeps several scrollable widgets (and scrollbars) at the same position,
+e.g. a frozen header and row labels that scroll with a table body.
+	group = ScrollGroup('vertical')
+	group.add(body)         # a ScrolledFrame, Canvas, Text, Listbox...
+	group.add(row_labels)
+	group.add_scrollbar(scrollbar)
+when any member's view changes the others, and the scrollbars, are moved
+to match once per frame, moves the group makes itself are not passed on
+again. members should have the same scroll length for positions to line up.
+members and scrollbars leave the group when they are destroyed, or remove().
+'''
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+try:
+	from .scheduler import Scheduler
+except ImportError: # imported by the customscrollbar demo run as a script
+	from scheduler import Scheduler
+
+__all__ = ['ScrollGroup']
+
+class ScrollGroup(object):
+	def __init__(self, orient='vertical'):
+		if orient == 'vertical':
+			self._view, self._option, self._bars = 'yview', 'yscrollcommand', ('vsb', 'vbar')
+		elif orient == 'horizontal':
+			self._view, self._option, self._bars = 'xview', 'xscrollcommand', ('hsb',)
+		else:
+			raise ValueError("orient must be 'vertical' or 'horizontal'")
+		self.members = []
+		self.scrollbars = []
+		self._fractions = {} # member: last (first, last) it reported
+		self._source = None # member that moved last
+		self._moved = set() # members moved by the group, not yet settled
+		self._own_bars = {} # member: scrollbar added with it, given back on remove
+
+	def add(self, widget, scrollbar=None):
+		'''
+		add a scrollable widget, a ScrolledFrame scrolls its canvas.
+		the widget's own scrollbar (ScrolledFrame, ScrolledText) is added
+		too unless another is given
+		'''
+		member = widget if isinstance(widget, tk.Misc) else widget.canvas
+		if scrollbar is None:
+			for name in self._bars:
+				scrollbar = getattr(widget, name, None)
+				if scrollbar is not None:
+					break
+		member.configure(**{self._option:
+			lambda first, last, member=member: self._scrolled(member, first, last)})
+		self.members.append(member)
+		self._watch(member)
+		if scrollbar is not None:
+			self.add_scrollbar(scrollbar)
+			self._own_bars[member] = scrollbar
+
+	def add_scrollbar(self, scrollbar):
+		'''add a scrollbar that shows, and controls, the group position'''
+		scrollbar.configure(command=self.view)
+		self.scrollbars.append(scrollbar)
+		self._watch(scrollbar)
+
+	def remove(self, widget):
+		'''
+		take a member or scrollbar out of the group, a member's own scrollbar
+		is taken out with it and linked back to it
+		'''
+		member = widget if isinstance(widget, tk.Misc) else widget.canvas
+		if member in self.members:
+			scrollbar = self._own_bars.pop(member, None)
+			self._forget(member)
+			if scrollbar is not None:
+				self._forget(scrollbar)
+				member.configure(**{self._option: scrollbar.set})
+				scrollbar.configure(command=getattr(member, self._view))
+			else:
+				member.configure(**{self._option: ''})
+		elif member in self.scrollbars:
+			self._forget(member)
+			member.configure(command='')
+		else:
+			raise ValueError('%s is not in the group' % widget)
+
+	def _tag(self, widget):
+		# one per widget, a class binding's callback is deleted with the widget that made it
+		return 'ScrollGroup%x%s' % (id(self), widget)
+
+	def _watch(self, widget):
+		tag = self._tag(widget)
+		widget.bind_class(tag, '<Destroy>', lambda event, widget=widget: self._forget(widget))
+		widget.bindtags((tag,) + tuple(widget.bindtags()))
+
+	def _forget(self, widget):
+		tag = self._tag(widget)
+		widget.unbind_class(tag, '<Destroy>')
+		if widget.winfo_exists():
+			widget.bindtags(tuple(t for t in widget.bindtags() if t != tag))
+		if widget in self.members:
+			self.members.remove(widget)
+			self._fractions.pop(widget, None)
+			self._moved.discard(widget)
+			self._own_bars.pop(widget, None)
+			if self._source is widget:
+				self._source = None
+		if widget in self.scrollbars:
+			self.scrollbars.remove(widget)
+			for member, scrollbar in list(self._own_bars.items()):
+				if scrollbar is widget:
+					del self._own_bars[member]
+
+	def view(self, *args):
+		'''scrollbar command, scrolls the first member and the rest follow'''
+		if self.members:
+			return getattr(self.members[0], self._view)(*args)
+
+	def _scrolled(self, member, first, last):
+		if member not in self.members:
+			return # reported after it was removed
+		self._fractions[member] = (first, last)
+		if member in self._moved:
+			return # following a move made by the group
+		self._source = member
+		Scheduler.get(member).submit(self._sync)
+
+	def _sync(self):
+		source = self._source
+		if source is None:
+			return # removed since it moved
+		first, last = self._fractions[source]
+		for scrollbar in self.scrollbars:
+			scrollbar.set(first, last)
+		for member in self.members:
+			if member is source:
+				continue
+			current = self._fractions.get(member)
+			if current and (float(current[0]) == float(first)):
+				continue
+			self._moved.add(member)
+			getattr(member, self._view)('moveto', first)
+		if self._moved:
+			# tk reports the moves when idle, by the next frame they are done
+			Scheduler.get(source).submit(self._settle)
+
+	def _settle(self):
+		self._moved.clear()
@@ -0,0 +1,169 @@
+'''
+Opt in counting and timing of the Tcl commands a widget sends to Tk.
+	profiler = TclProfiler()
+	profiler.attach(scrolledframe)
+	... use the application ...
+	profiler.dump()
+attaching replaces the interpreter (the tk attribute) of the widget, its
+children and any child created later with a wrapper around call, each
+command is recorded against the attached widget, the Python method that
+made it and the Tcl command. detach() puts the interpreters back.
+'''
+import os
+import sys
+import time
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+__all__ = ['TclProfiler']
+
+# commands reported with their subcommand, e.g. 'winfo width'
+_ensembles = set(['after', 'clipboard', 'event', 'focus', 'font', 'grab', 'grid',
+	'image', 'option', 'pack', 'place', 'selection', 'tk', 'winfo', 'wm'])
+
+# frames in tkinter itself are skipped to find the method responsible
+_tkinter_dir = os.path.dirname(tk.__file__)
+
+class _CallRecorder(object):
+	'''stands in for a widget's tkapp, recording call and passing everything else on'''
+	def __init__(self, tkapp, profiler, label):
+		self._tkapp = tkapp
+		self._profiler = profiler
+		self._label = label
+
+	def call(self, *args):
+		if not self._profiler.enabled:
+			return self._tkapp.call(*args)
+		start = time.perf_counter()
+		try:
+			return self._tkapp.call(*args)
+		finally:
+			self._profiler._record(self._label, args, time.perf_counter() - start)
+
+	def __getattr__(self, name):
+		return getattr(self._tkapp, name)
+
+class TclProfiler(object):
+	def __init__(self):
+		self.enabled = True
+		# (widget label, method, tcl command): [calls, seconds]
+		self.stats = {}
+		self._attached = [] # (widget, original tk)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.detach()
+
+	def attach(self, widget, label=None):
+		'''
+		record the Tcl commands of widget and its children under label
+		(default the class and path of widget), widget may also be an object
+		holding widgets such as ScrolledFrame or DebugLogger
+		'''
+		if label is None:
+			label = '%s %s' % (widget.__class__.__name__, widget)
+		self.enabled = True
+		for w in self._widgets(widget):
+			tkapp = w.tk
+			if isinstance(tkapp, _CallRecorder) and (tkapp._profiler is self):
+				# attached already, its original is saved
+				w.tk = _CallRecorder(tkapp._tkapp, self, label)
+				continue
+			self._attached.append((w, tkapp))
+			w.tk = _CallRecorder(tkapp, self, label)
+
+	def _widgets(self, obj, found=None, seen=None):
+		'''returns obj (if a widget) and the widgets under it, each once'''
+		if found is None:
+			found, seen = [], set()
+		if isinstance(obj, tk.Misc):
+			if id(obj) in seen:
+				return found
+			seen.add(id(obj))
+			found.append(obj)
+			for child in list(obj.children.values()):
+				self._widgets(child, found, seen)
+			return found
+		# composite object, profile the widgets it holds (often more than once)
+		for value in vars(obj).values():
+			if isinstance(value, tk.Misc):
+				self._widgets(value, found, seen)
+		return found
+
+	def detach(self):
+		'''stop recording and restore the interpreters of every attached widget,
+		and of children created since, which inherited the recorder'''
+		self.enabled = False
+		for w, tkapp in reversed(self._attached):
+			for child in self._widgets(w)[1:]:
+				recorder = child.tk
+				if isinstance(recorder, _CallRecorder) and (recorder._profiler is self):
+					child.tk = recorder._tkapp
+			w.tk = tkapp
+		self._attached = []
+
+	def reset(self):
+		self.stats = {}
+
+	@staticmethod
+	def _command(args):
+		if len(args) == 1 and isinstance(args[0], tuple):
+			args = args[0]
+		if not args:
+			return ''
+		first = str(args[0])
+		if first.startswith('.'):
+			# widget command, the subcommand (coords, insert, ...) is what matters
+			return str(args[1]) if len(args) > 1 else first
+		if (first in _ensembles) and (len(args) > 1) and isinstance(args[1], str):
+			return '%s %s' % (first, args[1])
+		return first
+
+	@staticmethod
+	def _method():
+		frame = sys._getframe(3) # skip this, _record and call
+		while frame and frame.f_code.co_filename.startswith(_tkinter_dir):
+			frame = frame.f_back
+		if frame is None:
+			return '?'
+		code = frame.f_code
+		return getattr(code, 'co_qualname', code.co_name)
+
+	def _record(self, label, args, seconds):
+		key = (label, self._method(), self._command(args))
+		try:
+			stat = self.stats[key]
+		except KeyError:
+			stat = self.stats[key] = [0, 0.0]
+		stat[0] += 1
+		stat[1] += seconds
+
+	def report(self, by=('widget', 'method', 'command')):
+		'''
+		returns [(key, calls, seconds)] summed over the fields in by
+		('widget', 'method', 'command'), most time first
+		'''
+		fields = ('widget', 'method', 'command')
+		indices = [fields.index(field) for field in by]
+		totals = {}
+		for key, (calls, seconds) in self.stats.items():
+			group = tuple(key[i] for i in indices)
+			total = totals.setdefault(group, [0, 0.0])
+			total[0] += calls
+			total[1] += seconds
+		rows = [(group, calls, seconds) for group, (calls, seconds) in totals.items()]
+		rows.sort(key=lambda row: row[2], reverse=True)
+		return rows
+
+	def dump(self, by=('widget', 'method', 'command'), file=None, limit=None):
+		'''print the report, one line per group'''
+		file = file or sys.stdout
+		file.write('%8s %10s %8s  %s\n' % ('calls', 'total ms', 'mean us', ' / '.join(by)))
+		for group, calls, seconds in self.report(by)[:limit]:
+			file.write('%8d %10.2f %8.1f  %s\n' % (calls, seconds * 1000,
+				seconds * 1e6 / calls, ' / '.join(group)))
@@ -0,0 +1,273 @@
+#!python3.4
+'''
+Stop a tkinter window from taking focus when it is clicked, for on screen
+keyboards and overlays that must leave focus with another application.
+	set_no_focus(toplevel)
+on Windows the window extended style is changed through user32, on X11 the
+input hint (WM_HINTS) is cleared through libX11 so the window manager doesn't
+give it focus, a window type can also be set.
+'''
+
+try:
+	import tkinter as tk
+except ImportError:
+	import Tkinter as tk
+
+__all__ = ['set_no_focus']
+
+GWL_STYLE = -16
+GWL_EXSTYLE = -20
+
+WS_CHILD = 0x40000000
+
+WS_EX_APPWINDOW = 0x00040000
+WS_EX_TOOLWINDOW = 0x00000080
+WS_EX_NOACTIVATE = 0x08000000
+
+SWP_FRAMECHANGED = 0x0020
+SWP_NOACTIVATE = 0x0010
+SWP_NOMOVE = 0x0002
+SWP_NOSIZE = 0x0001
+
+# XWMHints flags
+InputHint = 1 << 0
+
+_user32 = None
+_x11 = None
+_x11_displays = {} # display name: connection, kept open for later windows
+# bind tag of windows whose input hint is set again when they are mapped
+_no_focus_tag = 'TkwidgetsNoFocus'
+
+def _load_user32():
+	# only loaded the first time a window is changed on Windows
+	global _user32
+	if _user32 is None:
+		from ctypes import windll, wintypes
+		#TODO fix imports to automatically pic 32 bit or 64 bit versions depending on windows version
+		# specify argument and return types
+		user32 = windll.user32
+		user32.GetWindowLongW.restype = wintypes.ULONG
+		user32.GetWindowLongW.argtypes = (wintypes.HWND, wintypes.INT)
+		user32.SetWindowLongW.restype = wintypes.ULONG
+		user32.SetWindowLongW.argtypes = (wintypes.HWND, wintypes.INT, wintypes.ULONG)
+		_user32 = user32
+	return _user32
+
+def _load_x11():
+	# only loaded the first time a window is changed on X11
+	global _x11
+	if _x11 is None:
+		import ctypes
+		import ctypes.util
+		class XWMHints(ctypes.Structure):
+			_fields_ = [('flags', ctypes.c_long),
+						('input', ctypes.c_int),
+						('initial_state', ctypes.c_int),
+						('icon_pixmap', ctypes.c_ulong),
+						('icon_window', ctypes.c_ulong),
+						('icon_x', ctypes.c_int),
+						('icon_y', ctypes.c_int),
+						('icon_mask', ctypes.c_ulong),
+						('window_group', ctypes.c_ulong)]
+		class XErrorEvent(ctypes.Structure):
+			_fields_ = [('type', ctypes.c_int),
+						('display', ctypes.c_void_p),
+						('resourceid', ctypes.c_ulong),
+						('serial', ctypes.c_ulong),
+						('error_code', ctypes.c_ubyte),
+						('request_code', ctypes.c_ubyte),
+						('minor_code', ctypes.c_ubyte)]
+		x11 = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11') or 'libX11.so.6')
+		x11.XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(XErrorEvent))
+		x11.XSetErrorHandler.restype = x11.XErrorHandler
+		x11.XSetErrorHandler.argtypes = (x11.XErrorHandler,)
+		x11.XSync.argtypes = (ctypes.c_void_p, ctypes.c_int)
+		x11.XOpenDisplay.restype = ctypes.c_void_p
+		x11.XOpenDisplay.argtypes = (ctypes.c_char_p,)
+		x11.XQueryTree.argtypes = (ctypes.c_void_p, ctypes.c_ulong,
+			ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong),
+			ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_uint))
+		x11.XGetWMHints.restype = ctypes.POINTER(XWMHints)
+		x11.XGetWMHints.argtypes = (ctypes.c_void_p, ctypes.c_ulong)
+		x11.XAllocWMHints.restype = ctypes.POINTER(XWMHints)
+		x11.XSetWMHints.argtypes = (ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XWMHints))
+		x11.XFree.argtypes = (ctypes.c_void_p,)
+		_x11 = x11
+	return _x11
+
+def _x11_display(win):
+	# a connection of our own, window properties are shared with Tk's through the server
+	name = win.winfo_screen()
+	try:
+		return _x11_displays[name]
+	except KeyError:
+		display = _load_x11().XOpenDisplay(name.encode())
+		if not display:
+			raise RuntimeError("can't open display %s" % name)
+		_x11_displays[name] = display
+		return display
+
+def _x11_trapped(display, func, *args):
+	'''
+	calls func(*args) and waits for the server to handle it, with X errors on
+	our connection trapped, Xlib's default handler would exit the process.
+	Tk's handler is put back after, and still gets errors on its own connection.
+	raises RuntimeError if there was an error
+	'''
+	x11 = _load_x11()
+	errors = []
+	def handler(error_display, event):
+		if error_display == display:
+			errors.append(event.contents.error_code)
+			return 0
+		return previous(error_display, event) if previous else 0
+	callback = x11.XErrorHandler(handler)
+	previous = x11.XSetErrorHandler(callback)
+	try:
+		result = func(*args)
+		x11.XSync(display, 0)
+	finally:
+		x11.XSetErrorHandler(previous)
+	if errors:
+		raise RuntimeError("X error %d from %s" % (errors[0], func.__name__))
+	return result
+
+def _windowing_system(win):
+	# asked once per interpreter, stored on the root
+	root = win._root()
+	try:
+		return root._no_focus_ws
+	except AttributeError:
+		root._no_focus_ws = win.tk.call('tk', 'windowingsystem')
+		return root._no_focus_ws
+
+def find_root_window(win): # takes tkinter window ref
+	'''returns the handle of the frame windows puts around a toplevel,
+	looked up once and stored on the widget'''
+	try:
+		return win._no_focus_hwnd
+	except AttributeError:
+		win.update_idletasks() # the frame only exists once the window has been drawn
+		win._no_focus_hwnd = int(win.wm_frame(), 16)
+		return win._no_focus_hwnd
+
+def _set_no_focus_win32(win):
+	user32 = _load_user32()
+	hwnd = find_root_window(win)
+	style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE) # get existing style
+	newstyle = (style & ~WS_EX_TOOLWINDOW) | WS_EX_NOACTIVATE | WS_EX_APPWINDOW
+	if newstyle != style: # skip the redraw if already set
+		user32.SetWindowLongW(hwnd, GWL_EXSTYLE, newstyle)
+		user32.SetWindowPos(hwnd, 0, 0,0,0,0, SWP_FRAMECHANGED | SWP_NOACTIVATE | SWP_NOMOVE | SWP_NOSIZE)
+
+def find_wrapper_window(win):
+	'''returns the X11 id of the wrapper Tk puts around a toplevel, which
+	holds its window manager properties, looked up once and stored on the widget'''
+	try:
+		return win._no_focus_wrapper
+	except AttributeError:
+		import ctypes
+		x11 = _load_x11()
+		display = _x11_display(win)
+		root, parent = ctypes.c_ulong(), ctypes.c_ulong()
+		children, count = ctypes.c_void_p(), ctypes.c_uint()
+		status = _x11_trapped(display, x11.XQueryTree, display, win.winfo_id(), ctypes.byref(root),
+			ctypes.byref(parent), ctypes.byref(children), ctypes.byref(count))
+		if children:
+			x11.XFree(children)
+		if not (status and parent.value):
+			raise RuntimeError("can't find the window manager window of %s" % win)
+		win._no_focus_wrapper = parent.value
+		return win._no_focus_wrapper
+
+def _x11_hints(win):
+	# returns the display, wrapper and WM_HINTS (maybe NULL) of win
+	display = _x11_display(win)
+	wrapper = find_wrapper_window(win)
+	try:
+		return display, wrapper, _x11_trapped(display, _load_x11().XGetWMHints, display, wrapper)
+	except RuntimeError:
+		del win._no_focus_wrapper # looked up again next time
+		raise
+
+def get_input_hint(win):
+	'''returns the X11 input hint of a mapped toplevel, False if it
+	asks the window manager not to give it focus'''
+	x11 = _load_x11()
+	display, wrapper, hints = _x11_hints(win)
+	if not hints:
+		return True # no hints, window managers give focus
+	try:
+		return (not (hints.contents.flags & InputHint)) or bool(hints.contents.input)
+	finally:
+		x11.XFree(hints)
+
+def _set_input_hint_x11(win):
+	x11 = _load_x11()
+	display, wrapper, hints = _x11_hints(win)
+	hints = hints or x11.XAllocWMHints()
+	try:
+		if (hints.contents.flags & InputHint) and not hints.contents.input:
+			return # already set
+		hints.contents.flags |= InputHint
+		hints.contents.input = 0
+		_x11_trapped(display, x11.XSetWMHints, display, wrapper, hints)
+	finally:
+		x11.XFree(hints)
+
+def _on_map_x11(event):
+	# Tk writes its own hints when mapping, and again when iconified
+	_set_input_hint_x11(event.widget)
+
+def _set_no_focus_x11(win, window_type):
+	win.configure(takefocus=0)
+	bindtags = win.bindtags()
+	if _no_focus_tag not in bindtags:
+		root = win._root()
+		if not getattr(root, '_no_focus_bound', False):
+			# bound through the root so the handler lasts as long as the interpreter
+			root.bind_class(_no_focus_tag, '<Map>', _on_map_x11)
+			root._no_focus_bound = True
+		win.bindtags((_no_focus_tag,) + bindtags)
+	if window_type is not None:
+		win.wm_attributes('-type', window_type)
+	if win.winfo_ismapped():
+		_set_input_hint_x11(win)
+		if window_type is not None:
+			# the window manager only reads the type when the window is mapped
+			win.wm_withdraw()
+			win.wm_deiconify()
+
+def set_no_focus(win, window_type=None):
+	'''
+	Stop win (a Tk or Toplevel) from taking focus when clicked.
+	on X11 the input hint is cleared, as on screen keyboards do, and it is
+	set again whenever the window is mapped. window_type is an optional
+	_NET_WM_WINDOW_TYPE for the window manager as well, e.g. 'utility' for
+	a decorated window kept above the application, 'dock' for an undecorated
+	panel on every desktop, or 'notification'.
+	it is cheapest to call before the window is first shown.
+	'''
+	ws = _windowing_system(win)
+	if ws == 'win32':
+		_set_no_focus_win32(win)
+	elif ws == 'x11':
+		_set_no_focus_x11(win, window_type)
+	else:
+		raise NotImplementedError("set_no_focus is not supported on %s" % ws)
+
+if __name__ == '__main__':
+	def push_me():
+		print('you pushed me!')
+
+	def focus_me(event):
+		root.focus_force()
+
+	root = tk.Tk()
+	root.wm_attributes("-topmost", 1)
+	tk.Button(root, text="Push me", command=push_me).pack()
+	e = tk.Entry(root)
+	e.pack()
+	e.bind('<Button-1>', focus_me) # if we have a widget that must have focus it needs to be bound
+	set_no_focus(root)
+	root.mainloop()